@@ -0,0 +1,164 @@
+#! /usr/bin/env python3
+# author : S. Mandalia
+#          shivesh.mandalia@outlook.com
+#
+# date   : October 18, 2026
+
+
+"""
+Convergence and variance reduction of the MC estimators.
+
+Every estimator configuration is run with repeated seeds on each payoff type
+over a matrix of market parameters, and scored against analytic or high
+precision references by its bias, RMSE and time to target precision. The
+import and start-up times of short-lived pricing processes are reported
+first.
+
+"""
+
+import time
+from typing import Dict, List
+
+from utils.compare import Case, Score, compare, product, recommend, reference
+from utils.compare import startup_time
+from utils.engine import PricingEngine
+from utils.lite import Worker
+from utils.path import MultiPathGenerator, PathGenerator
+from utils.payoff import AsianArithmeticPayOff, BasePayoff
+from utils.payoff import BasketAsianArithmeticPayOff
+from utils.payoff import BasketDiscreteBarrierPayOff, DiscreteBarrierPayOff
+from utils.payoff import VanillaPayOff
+
+
+__all__ = ['startup', 'cases']
+
+
+def startup() -> None:
+    """Import and start-up times of short-lived pricing processes."""
+    print('==================')
+    print('Start-up times')
+    print('==================')
+
+    job = {
+        'payoff': 'VanillaPayOff', 'option_right': 'Call', 'K': 103,
+        'S': 100, 'r': 0.05, 'div': 0.03, 'vol': 0.1, 'T': [0, 1],
+        'ntrials': 1_000, 'seed': 1
+    }
+    statements = {
+        'interpreter': 'pass',
+        'import utils.lite': 'import utils.lite',
+        'import utils.engine': 'import utils.engine',
+        'import utils.plan': 'import utils.plan',
+        'first job': f'from utils.lite import price; price({job!r})',
+        'first job in worker': 'from utils.lite import Worker\n'
+                               f'with Worker() as x: x.price({job!r})',
+    }
+    for name, statement in statements.items():
+        print('{0:<24}{1:>8.1f} ms'.format(
+            name, startup_time(statement) * 1e3
+        ))
+
+    # Latency of a job sent to a worker which has already warmed up
+    with Worker() as worker:
+        worker.price(job)
+        start = time.perf_counter()
+        worker.price(job)
+        warm = time.perf_counter() - start
+    print('{0:<24}{1:>8.1f} ms'.format('warm job in worker', warm * 1e3))
+
+
+def cases() -> List[Case]:
+    """Cases covering every payoff type and a matrix of markets."""
+    # Maturity in one year with monthly setting dates, struck at 103
+    T = [x / 12 for x in range(12 + 1)]
+    payoffs: Dict[str, BasePayoff] = {
+        'vanilla': VanillaPayOff(K=103, option_right='Call'),
+        'asian': AsianArithmeticPayOff(K=103, option_right='Call'),
+        'down-and-out': DiscreteBarrierPayOff(
+            K=103, option_right='Call', B=80, barrier_updown='Down',
+            barrier_inout='Out'
+        ),
+        'down-and-in': DiscreteBarrierPayOff(
+            K=103, option_right='Call', B=80, barrier_updown='Down',
+            barrier_inout='In'
+        ),
+    }
+    basket_payoffs: Dict[str, BasePayoff] = {
+        'basket asian': BasketAsianArithmeticPayOff(
+            K=103, option_right='Call', basket='Basket'
+        ),
+        'worst-of down-and-in': BasketDiscreteBarrierPayOff(
+            K=103, option_right='Call', B=80, barrier_updown='Down',
+            barrier_inout='In', basket='WorstOf'
+        ),
+    }
+
+    all_cases: List[Case] = []
+    for S in (84, 100):
+        for vol in (0.1, 0.3):
+            market = f'S={S}, vol={vol}'
+            path = PathGenerator(S=S, r=0.05, div=0.03, vol=vol)
+            for name, payoff in payoffs.items():
+                all_cases.append(Case(
+                    f'{name} ({market})', PricingEngine(payoff, path), T
+                ))
+            multi_path = MultiPathGenerator(
+                S=[S, S], r=[0.05, 0.05], div=[0.03, 0.03], vol=[vol, vol],
+                corr=[[1., 0.5], [0.5, 1.]]
+            )
+            for name, payoff in basket_payoffs.items():
+                all_cases.append(Case(
+                    f'{name} ({market})', PricingEngine(payoff, multi_path), T
+                ))
+    return all_cases
+
+
+def main() -> None:
+    # Import and start-up times
+    startup()
+
+    # Number of trials per price, repeats and target RMSE
+    ntrials = 10_000
+    nrepeats = 20
+    target = 0.01
+
+    scores: List[Score] = []
+    products: Dict[str, str] = {}
+    for case in cases():
+        ref = reference(case)
+        print('==================')
+        print('{0}: reference = {1:.4f} +- {2:.4f}'.format(
+            case.name, ref.price, ref.stderr
+        ))
+        print('{0:<12}{1:>10}{2:>10}{3:>10}{4:>10}{5:>12}'.format(
+            'estimator', 'bias', 'rmse', 'se ratio', 'time', 'to target'
+        ))
+        case_scores = compare(case, ntrials=ntrials, nrepeats=nrepeats,
+                              target=target, ref=ref)
+        for score in case_scores:
+            print('{0:<12}{1:>10.4f}{2:>10.4f}{3:>10.2f}{4:>9.3f}s'
+                  '{5:>11.2f}s'.format(
+                      score.estimator, score.bias, score.rmse,
+                      score.stderr_ratio, score.time, score.time_to_target
+                  ))
+        scores.extend(case_scores)
+        products[case.name] = product(case.engine)
+
+    print('==================')
+    print('Recommended estimators, with cost relative to the best on each')
+    print('case, for an RMSE of {0} with {1} trials and {2} repeats'.format(
+        target, ntrials, nrepeats
+    ))
+    print('==================')
+    for prod, ranking in recommend(scores, products).items():
+        print('{0}: {1}'.format(prod, ', '.join(
+            '{0} ({1:.2f})'.format(name, cost) for name, cost in ranking
+        )))
+    print('==================')
+
+
+main.__doc__ = __doc__
+
+
+if __name__ == '__main__':
+    main()
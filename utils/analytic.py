@@ -0,0 +1,75 @@
+# author : S. Mandalia
+#          shivesh.mandalia@outlook.com
+#
+# date   : October 18, 2026
+
+"""
+Analytic prices of options.
+"""
+
+import math
+
+from utils.enums import OptionRight
+from utils.misc import Number
+from utils.path import PathGenerator
+
+
+__all__ = ['black_scholes']
+
+
+def _norm_cdf(x: float) -> float:
+    """Standard normal cumulative distribution function."""
+    return (1 + math.erf(x / math.sqrt(2))) / 2
+
+
+def black_scholes(
+        path: PathGenerator,
+        K: Number,
+        option_right: OptionRight,
+        tau: Number
+) -> float:
+    """
+    Black-Scholes price of a vanilla option.
+
+    The underlying drifts at the net rate r - d and the payoff is discounted
+    at the risk free rate r, consistently with `PathGenerator` and
+    `PricingEngine`.
+
+    Parameters
+    ----------
+    path : PathGenerator
+        PathGenerator object for the underlying.
+    K : Number
+        Strike price.
+    option_right : OptionRight
+        Right of the option.
+    tau : Number
+        Time to maturity in years.
+
+    Returns
+    -------
+    float
+        Price of the option.
+
+    Examples
+    --------
+    >>> from utils.analytic import black_scholes
+    >>> from utils.enums import OptionRight
+    >>> from utils.path import PathGenerator
+    >>> path = PathGenerator(S=100., r=0.1, div=0.01, vol=0.3)
+    >>> print(black_scholes(path, K=110, option_right=OptionRight.Call, tau=1))
+    11.574597717155632
+
+    """
+    df = math.exp(-path.discount_rate * tau)
+    forward = path.S * math.exp(path.net_r * tau)
+    sigma = path.vol * math.sqrt(tau)
+    sign = 1 if option_right == OptionRight.Call else -1
+    if sigma <= 0:
+        return df * max(sign * (forward - K), 0.)
+
+    d1 = (math.log(forward / K) + sigma**2 / 2) / sigma
+    d2 = d1 - sigma
+    return sign * df * (
+        forward * _norm_cdf(sign * d1) - K * _norm_cdf(sign * d2)
+    )
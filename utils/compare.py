@@ -0,0 +1,391 @@
+# author : S. Mandalia
+#          shivesh.mandalia@outlook.com
+#
+# date   : October 18, 2026
+
+"""
+Comparison of the convergence of MC estimators.
+"""
+
+import math
+import os
+import random
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from statistics import mean, pstdev
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from utils.analytic import black_scholes
+from utils.engine import MCResult, PricingEngine
+from utils.enums import BarrierInOut
+from utils.misc import Number
+from utils.path import PathGenerator
+from utils.payoff import BasketMixin, DiscreteBarrierPayOff, VanillaPayOff
+from utils.plan import SimulationPlan
+
+
+__all__ = ['Case', 'Estimator', 'Score', 'ESTIMATORS', 'product', 'reference',
+           'compare', 'recommend', 'startup_time']
+
+
+@dataclass
+class Case:
+    """
+    Option and market on which to compare estimators.
+
+    Attributes
+    ----------
+    name : str
+        Name of the case.
+    engine : PricingEngine
+        Pricing engine for the option.
+    T : Sequence of Numbers
+        Set of times {t1, t2, ..., tn} in years.
+
+    """
+    __slots__ = ['name', 'engine', 'T']
+    name: str
+    engine: PricingEngine
+    T: Sequence[Number]
+
+
+@dataclass
+class Estimator:
+    """
+    Configuration of the MC estimator of a price.
+
+    Attributes
+    ----------
+    name : str
+        Name of the configuration.
+    price : Callable
+        Function of the case, the number of trials and a seed returning the
+        MCResult.
+    applies : Callable
+        Function of the pricing engine returning whether the configuration is
+        available for it.
+
+    """
+    __slots__ = ['name', 'price', 'applies']
+    name: str
+    price: Callable[[Case, int, int], MCResult]
+    applies: Callable[[PricingEngine], bool]
+
+
+@dataclass
+class Score:
+    """
+    Accuracy and cost of an estimator on a case.
+
+    Attributes
+    ----------
+    case : str
+        Name of the case.
+    estimator : str
+        Name of the estimator.
+    bias : float
+        Mean error of the prices relative to the reference.
+    rmse : float
+        Root mean square error of the prices relative to the reference.
+    stderr_ratio : float
+        Mean reported standard error over the spread of the prices, near one
+        if the reported errors are reliable.
+    time : float
+        Mean time in seconds per price.
+    time_to_target : float
+        Time in seconds to reach the target RMSE, assuming the RMSE falls as
+        the inverse square root of the number of trials.
+
+    """
+    __slots__ = ['case', 'estimator', 'bias', 'rmse', 'stderr_ratio', 'time',
+                 'time_to_target']
+    case: str
+    estimator: str
+    bias: float
+    rmse: float
+    stderr_ratio: float
+    time: float
+    time_to_target: float
+
+
+def _single_asset(engine: PricingEngine) -> bool:
+    """Whether the engine prices an option on a single underlying."""
+    return isinstance(engine.path, PathGenerator) and \
+        not isinstance(engine.payoff, BasketMixin)
+
+
+def _knock_in(engine: PricingEngine) -> bool:
+    """Whether the engine prices a single asset knock-in option."""
+    return _single_asset(engine) and \
+        isinstance(engine.payoff, DiscreteBarrierPayOff) and \
+        engine.payoff.barrier_inout == BarrierInOut.In
+
+
+def _engine(antithetic: bool) -> Callable[[Case, int, int], MCResult]:
+    """Estimator simulating the payoff directly with the engine."""
+    def price(case: Case, ntrials: int, seed: int) -> MCResult:
+        random.seed(seed)
+        return case.engine.price(case.T, ntrials, antithetic=antithetic,
+                                 parity=False)
+    return price
+
+
+def _corrected(case: Case, ntrials: int, seed: int) -> MCResult:
+    """Estimator post-processing batches of paths."""
+    random.seed(seed)
+    return case.engine.price_corrected(case.T, ntrials)
+
+
+def _parity(case: Case, ntrials: int, seed: int) -> MCResult:
+    """Estimator pricing knock-ins by in-out parity."""
+    random.seed(seed)
+    return case.engine.price(case.T, ntrials, parity=True)
+
+
+def _compiled(case: Case, ntrials: int, seed: int) -> MCResult:
+    """Estimator running a compiled simulation plan."""
+    if not isinstance(case.engine.path, PathGenerator):
+        raise TypeError('Compiled plans require a PathGenerator, instead got '
+                        f'type {type(case.engine.path)}!')
+    plan = SimulationPlan(case.engine.path, case.T, case.engine.payoff)
+    return plan.run(ntrials, seed=seed)
+
+
+ESTIMATORS: Tuple[Estimator, ...] = (
+    Estimator('plain', _engine(antithetic=False), lambda x: True),
+    Estimator('antithetic', _engine(antithetic=True), lambda x: True),
+    Estimator('compiled', _compiled, _single_asset),
+    Estimator('corrected', _corrected, _single_asset),
+    Estimator('parity', _parity, _knock_in),
+)
+"""Estimator configurations available in the engine."""
+
+
+def product(engine: PricingEngine) -> str:
+    """
+    Product type of the option priced by an engine, under which estimators
+    are recommended.
+
+    Examples
+    --------
+    >>> from utils.compare import product
+    >>> from utils.engine import PricingEngine
+    >>> from utils.path import PathGenerator
+    >>> from utils.payoff import DiscreteBarrierPayOff
+    >>> path = PathGenerator(S=100., r=0.1, div=0.01, vol=0.3)
+    >>> payoff = DiscreteBarrierPayOff(option_right='Call', K=100, B=90,
+    ...                                barrier_updown='Down',
+    ...                                barrier_inout='In')
+    >>> print(product(PricingEngine(payoff=payoff, path=path)))
+    DiscreteBarrierPayOff(In)
+
+    """
+    name = engine.payoff.__class__.__name__
+    if isinstance(engine.payoff, DiscreteBarrierPayOff):
+        name += f'({engine.payoff.barrier_inout.name})'
+    return name
+
+
+def reference(case: Case, ntrials: int = 1_000_000, seed: int = 0) -> MCResult:
+    """
+    Reference price of a case, independent of the estimators compared so
+    that their bias shows.
+
+    Parameters
+    ----------
+    case : Case
+        Case to price.
+    ntrials : int
+        Number of trials of the high precision MC price, for options without
+        an analytic price.
+    seed : int
+        Seed of the high precision MC price.
+
+    Returns
+    -------
+    MCResult
+        Analytic price with zero standard error for single asset vanilla
+        options, high precision MC price simulating the payoff directly,
+        without any variance reduction, otherwise.
+
+    """
+    engine = case.engine
+    if _single_asset(engine) and isinstance(engine.path, PathGenerator) and \
+            isinstance(engine.payoff, VanillaPayOff):
+        price = black_scholes(engine.path, engine.payoff.K,
+                              engine.payoff.option_right,
+                              case.T[-1] - case.T[0])
+        return MCResult(price, 0.)
+    random.seed(seed)
+    return engine.price(case.T, ntrials, antithetic=False, parity=False)
+
+
+def compare(
+        case: Case,
+        estimators: Sequence[Estimator] = ESTIMATORS,
+        ntrials: int = 10_000,
+        nrepeats: int = 20,
+        target: float = 0.01,
+        ref: Optional[MCResult] = None
+) -> List[Score]:
+    """
+    Score every applicable estimator on a case over repeated seeds.
+
+    Parameters
+    ----------
+    case : Case
+        Case to price.
+    estimators : Sequence of Estimator
+        Estimator configurations to compare.
+    ntrials : int
+        Number of trials per price.
+    nrepeats : int
+        Number of prices, each with a different seed, per estimator.
+    target : float
+        Target RMSE of the time to target precision.
+    ref : MCResult, optional
+        Reference price, calculated with `reference` if None. The error of
+        an MC reference adds to the RMSE, so it should be much smaller than
+        that of the estimators.
+
+    Returns
+    -------
+    List of Score
+        Scores from the fastest to the slowest to reach the target.
+
+    Examples
+    --------
+    >>> from utils.compare import Case, compare
+    >>> from utils.engine import PricingEngine
+    >>> from utils.path import PathGenerator
+    >>> from utils.payoff import VanillaPayOff
+    >>> path = PathGenerator(S=100., r=0.1, div=0.01, vol=0.3)
+    >>> payoff = VanillaPayOff(option_right='Call', K=110)
+    >>> case = Case('vanilla', PricingEngine(payoff=payoff, path=path), [0, 1])
+    >>> for score in compare(case, nrepeats=5):
+    ...     print(score.estimator, score.rmse)
+    corrected 0.02894267531084828
+    compiled 0.07455148578009237
+    antithetic 0.07455148578008879
+    plain 0.21595097485469808
+
+    """
+    if nrepeats < 2:
+        raise AssertionError('At least two repeats are required!')
+    if ref is None:
+        ref = reference(case)
+
+    scores: List[Score] = []
+    for estimator in estimators:
+        if not estimator.applies(case.engine):
+            continue
+        prices: List[float] = [0.] * nrepeats
+        stderrs: List[float] = [0.] * nrepeats
+        elapsed = 0.
+        for seed in range(nrepeats):
+            start = time.perf_counter()
+            result = estimator.price(case, ntrials, seed + 1)
+            elapsed += time.perf_counter() - start
+            prices[seed], stderrs[seed] = result.price, result.stderr
+
+        errors = [x - ref.price for x in prices]
+        rmse = math.sqrt(mean(x**2 for x in errors))
+        spread = pstdev(prices)
+        run_time = elapsed / nrepeats
+        scores.append(Score(
+            case=case.name,
+            estimator=estimator.name,
+            bias=mean(errors),
+            rmse=rmse,
+            stderr_ratio=mean(stderrs) / spread if spread > 0 else math.nan,
+            time=run_time,
+            time_to_target=run_time * (rmse / target)**2,
+        ))
+    return sorted(scores, key=lambda x: (x.time_to_target, x.time))
+
+
+def recommend(
+        scores: Sequence[Score], products: Dict[str, str]
+) -> Dict[str, List[Tuple[str, float]]]:
+    """
+    Rank the estimators for each product type.
+
+    On every case the time to target of each estimator is taken relative to
+    the fastest, or its time if no estimator has any error, and the relative
+    costs are averaged geometrically over the cases of a product type.
+
+    Parameters
+    ----------
+    scores : Sequence of Score
+        Scores of the estimators on every case.
+    products : Dict of str to str
+        Product type of every case, by name.
+
+    Returns
+    -------
+    Dict of str to List of (str, float)
+        Estimators and their relative costs for every product type, from the
+        cheapest to the most expensive.
+
+    """
+    by_case: Dict[str, List[Score]] = {}
+    for score in scores:
+        by_case.setdefault(score.case, []).append(score)
+
+    log_costs: Dict[str, Dict[str, List[float]]] = {}
+    for name, case_scores in by_case.items():
+        best = min(x.time_to_target for x in case_scores)
+        if best > 0:
+            costs = [x.time_to_target / best for x in case_scores]
+        else:
+            fastest = min(x.time for x in case_scores)
+            costs = [x.time / fastest for x in case_scores]
+        product_costs = log_costs.setdefault(products[name], {})
+        for score, cost in zip(case_scores, costs):
+            product_costs.setdefault(score.estimator, []).append(
+                math.log(cost)
+            )
+
+    return {
+        prod: sorted(
+            ((name, math.exp(mean(x))) for name, x in costs.items()),
+            key=lambda x: x[1]
+        )
+        for prod, costs in log_costs.items()
+    }
+
+
+def startup_time(statement: str, nrepeats: int = 5) -> float:
+    """
+    Wall time of a fresh interpreter running a statement, including its
+    start-up and imports.
+
+    Parameters
+    ----------
+    statement : str
+        Python statement to run, from the root of the repository.
+    nrepeats : int
+        Number of runs, of which the fastest is kept.
+
+    Returns
+    -------
+    float
+        Shortest wall time in seconds.
+
+    Examples
+    --------
+    >>> from utils.compare import startup_time
+    >>> print(startup_time('import utils.lite'))
+    0.026164737999806675
+
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    times: List[float] = [0.] * nrepeats
+    for idx in range(nrepeats):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', statement], cwd=root,
+                       check=True)
+        times[idx] = time.perf_counter() - start
+    return min(times)
@@ -0,0 +1,121 @@
+# author : S. Mandalia
+#          shivesh.mandalia@outlook.com
+#
+# date   : October 18, 2026
+
+"""
+Post-processing of batches of paths to reduce MC bias.
+"""
+
+import math
+from statistics import mean, pstdev
+from typing import List, Sequence
+
+from utils.misc import Number
+from utils.path import PathGenerator
+
+
+__all__ = ['match_moments', 'martingale_correct']
+
+
+def match_moments(
+        paths: Sequence[Sequence[float]],
+        path: PathGenerator,
+        T: Sequence[Number]
+) -> List[List[float]]:
+    """
+    Rescale the log increments of a batch of paths so that, on every step,
+    their sample mean and variance match the theoretical ones.
+
+    Parameters
+    ----------
+    paths : Sequence of Sequences of floats
+        Batch of paths {S_t1, S_t2, ..., S_tn}.
+    path : PathGenerator
+        PathGenerator object the paths were generated with.
+    T : Sequence of Numbers
+        Set of times {t1, t2, ..., tn} in years.
+
+    Returns
+    -------
+    List of Lists of floats
+        Corrected batch of paths.
+
+    Examples
+    --------
+    >>> from utils.correction import match_moments
+    >>> from utils.path import PathGenerator
+    >>> path = PathGenerator(S=100., r=0.1, div=0.01, vol=0.3)
+    >>> paths = [path.generate(T=range(3)) for _ in range(2)]
+    >>> print(match_moments(paths, path, T=range(3)))
+    [[100.0, 141.1989919667659, 199.37155332430822],
+     [100.0, 77.49164979610809, 60.0495578812266]]
+
+    """
+    if len(paths) < 2:
+        raise AssertionError('At least two paths are required!')
+    corrected = [[x[0]] for x in paths]
+    for idx in range(1, len(T)):
+        dt = T[idx] - T[idx - 1]
+        mu = (path.net_r - (1/2) * path.vol**2) * dt
+        sigma = path.vol * math.sqrt(dt)
+
+        # Standardise the log increments
+        log_incs = [math.log(x[idx] / x[idx - 1]) for x in paths]
+        inc_mean = mean(log_incs)
+        inc_std = pstdev(log_incs, inc_mean)
+        for c_path, inc in zip(corrected, log_incs):
+            if inc_std > 0:
+                inc = mu + (inc - inc_mean) / inc_std * sigma
+            else:
+                inc = mu
+            c_path.append(c_path[-1] * math.exp(inc))
+    return corrected
+
+
+def martingale_correct(
+        paths: Sequence[Sequence[float]],
+        path: PathGenerator,
+        T: Sequence[Number]
+) -> List[List[float]]:
+    """
+    Adjust a batch of paths so that the discounted spot price is an exact
+    martingale on every date, following the empirical martingale simulation
+    of Duan and Simonato.
+
+    Parameters
+    ----------
+    paths : Sequence of Sequences of floats
+        Batch of paths {S_t1, S_t2, ..., S_tn}.
+    path : PathGenerator
+        PathGenerator object the paths were generated with.
+    T : Sequence of Numbers
+        Set of times {t1, t2, ..., tn} in years.
+
+    Returns
+    -------
+    List of Lists of floats
+        Corrected batch of paths, whose mean on date t is S·e^{(r - d)t}.
+
+    Examples
+    --------
+    >>> from utils.correction import martingale_correct
+    >>> from utils.path import PathGenerator
+    >>> path = PathGenerator(S=100., r=0.1, div=0.01, vol=0.3)
+    >>> paths = [path.generate(T=range(3)) for _ in range(2)]
+    >>> print(martingale_correct(paths, path, T=range(3)))
+    [[100.0, 129.24960136511015, 176.48457858210594],
+     [100.0, 89.58525537593192, 62.95889404225606]]
+
+    """
+    corrected = [[x[0]] for x in paths]
+    for idx in range(1, len(T)):
+        forward = path.S * math.exp(path.net_r * (T[idx] - T[0]))
+        Z = [
+            c_path[-1] * x[idx] / x[idx - 1]
+            for c_path, x in zip(corrected, paths)
+        ]
+        scale = forward / mean(Z)
+        for c_path, z in zip(corrected, Z):
+            c_path.append(z * scale)
+    return corrected
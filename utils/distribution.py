@@ -0,0 +1,397 @@
+# author : S. Mandalia
+#          shivesh.mandalia@outlook.com
+#
+# date   : October 18, 2026
+
+"""
+Streaming summaries of the distribution of payoffs.
+"""
+
+import math
+from typing import Dict, Iterator, List, Optional, Tuple
+
+
+__all__ = ['QuantileSketch', 'Histogram', 'Distribution']
+
+
+class QuantileSketch:
+    """
+    Class for estimating quantiles of a stream of values in bounded memory.
+
+    Values are counted in logarithmically spaced buckets, so that every
+    quantile is estimated to within a relative accuracy, and two sketches
+    with the same accuracy can be merged by adding their counts.
+
+    Attributes
+    ----------
+    relative_accuracy : float
+        Relative accuracy of the quantile estimates.
+    n : int
+        Number of values.
+
+    Methods
+    -------
+    add(x)
+        Add a value.
+    merge(other)
+        Merge another sketch into this one.
+    quantile(q)
+        Estimate the q-quantile.
+    tail_mean(q)
+        Estimate the mean of the values above the q-quantile.
+
+    Examples
+    --------
+    >>> from utils.distribution import QuantileSketch
+    >>> sketch = QuantileSketch(relative_accuracy=0.01)
+    >>> for x in range(1, 101):
+    ...     sketch.add(x)
+    >>> print(sketch.quantile(0.5))
+    49.90296094906653
+
+    """
+    __slots__ = 'relative_accuracy', 'n', 'zeros', '_log_gamma', '_pos', \
+        '_neg'
+
+    def __init__(self, relative_accuracy: float = 0.01) -> None:
+        if not 0 < relative_accuracy < 1:
+            raise ValueError(f'Invalid relative_accuracy {relative_accuracy}, '
+                             'expected in (0, 1)')
+        self.relative_accuracy: float = relative_accuracy
+        self.n: int = 0
+        self.zeros: int = 0
+        gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma: float = math.log(gamma)
+        self._pos: Dict[int, int] = {}
+        self._neg: Dict[int, int] = {}
+
+    def __repr__(self) -> str:
+        return (
+            f'{self.__class__.__name__}('
+            f'relative_accuracy={self.relative_accuracy!r}, '
+            f'n={self.n!r}'
+            ')'
+        )
+
+    def _key(self, x: float) -> int:
+        """Bucket of a positive value."""
+        return math.ceil(math.log(x) / self._log_gamma)
+
+    def _value(self, key: int) -> float:
+        """Representative value of a bucket."""
+        gamma = math.exp(self._log_gamma)
+        return 2 * gamma**key / (gamma + 1)
+
+    def _buckets(self) -> Iterator[Tuple[float, int]]:
+        """Buckets in increasing order of value, as (value, count)."""
+        for key in sorted(self._neg, reverse=True):
+            yield -self._value(key), self._neg[key]
+        if self.zeros:
+            yield 0., self.zeros
+        for key in sorted(self._pos):
+            yield self._value(key), self._pos[key]
+
+    def add(self, x: float) -> None:
+        """Add a value."""
+        self.n += 1
+        if x > 0:
+            key = self._key(x)
+            self._pos[key] = self._pos.get(key, 0) + 1
+        elif x < 0:
+            key = self._key(-x)
+            self._neg[key] = self._neg.get(key, 0) + 1
+        else:
+            self.zeros += 1
+
+    def merge(self, other: 'QuantileSketch') -> 'QuantileSketch':
+        """Merge another sketch into this one."""
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError('Cannot merge sketches with different accuracy!')
+        self.n += other.n
+        self.zeros += other.zeros
+        for store, o_store in ((self._pos, other._pos),
+                               (self._neg, other._neg)):
+            for key, count in o_store.items():
+                store[key] = store.get(key, 0) + count
+        return self
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate the q-quantile.
+
+        Parameters
+        ----------
+        q : float
+            Quantile, between 0 and 1.
+
+        Returns
+        -------
+        float
+            Estimated quantile, NaN if the sketch is empty.
+
+        """
+        if not 0 <= q <= 1:
+            raise ValueError(f'Invalid quantile {q}, expected in [0, 1]')
+        if self.n == 0:
+            return math.nan
+        rank = q * (self.n - 1)
+        seen = 0
+        value = 0.
+        for value, count in self._buckets():
+            seen += count
+            if seen > rank:
+                break
+        return value
+
+    def tail_mean(self, q: float) -> float:
+        """
+        Estimate the mean of the values above the q-quantile.
+
+        Parameters
+        ----------
+        q : float
+            Quantile, between 0 and 1.
+
+        Returns
+        -------
+        float
+            Estimated mean of the upper tail, NaN if the sketch is empty.
+
+        """
+        if not 0 <= q < 1:
+            raise ValueError(f'Invalid quantile {q}, expected in [0, 1)')
+        if self.n == 0:
+            return math.nan
+        # Number of values in the tail, taking part of the boundary bucket
+        ntail = self.n * (1 - q)
+        buckets = list(self._buckets())
+        total = 0.
+        remaining = ntail
+        for value, count in reversed(buckets):
+            take = min(count, remaining)
+            total += take * value
+            remaining -= take
+            if remaining <= 0:
+                break
+        return total / ntail
+
+
+class Histogram:
+    """
+    Class for counting a stream of values in fixed bins.
+
+    Attributes
+    ----------
+    low : float
+        Lower edge of the first bin.
+    high : float
+        Upper edge of the last bin.
+    counts : List of ints
+        Number of values in each bin.
+    underflow : int
+        Number of values below `low`.
+    overflow : int
+        Number of values above or equal to `high`.
+
+    Methods
+    -------
+    add(x)
+        Add a value.
+    merge(other)
+        Merge another histogram with the same bins into this one.
+    edges()
+        Edges of the bins.
+
+    Examples
+    --------
+    >>> from utils.distribution import Histogram
+    >>> hist = Histogram(low=0., high=10., nbins=5)
+    >>> for x in (1., 3., 3.5, 12.):
+    ...     hist.add(x)
+    >>> print(hist)
+    Histogram(low=0.0, high=10.0, counts=[1, 2, 0, 0, 0], underflow=0,
+              overflow=1)
+
+    """
+    __slots__ = 'low', 'high', 'counts', 'underflow', 'overflow'
+
+    def __init__(self, low: float, high: float, nbins: int) -> None:
+        if not high > low or nbins < 1:
+            raise ValueError('Expected high > low and at least one bin!')
+        self.low: float = low
+        self.high: float = high
+        self.counts: List[int] = [0] * nbins
+        self.underflow: int = 0
+        self.overflow: int = 0
+
+    def __repr__(self) -> str:
+        return (
+            f'{self.__class__.__name__}('
+            f'low={self.low!r}, '
+            f'high={self.high!r}, '
+            f'counts={self.counts!r}, '
+            f'underflow={self.underflow!r}, '
+            f'overflow={self.overflow!r}'
+            ')'
+        )
+
+    def add(self, x: float) -> None:
+        """Add a value."""
+        if x < self.low:
+            self.underflow += 1
+        elif x >= self.high:
+            self.overflow += 1
+        else:
+            nbins = len(self.counts)
+            idx = int((x - self.low) / (self.high - self.low) * nbins)
+            self.counts[min(idx, nbins - 1)] += 1
+
+    def merge(self, other: 'Histogram') -> 'Histogram':
+        """Merge another histogram with the same bins into this one."""
+        if (other.low, other.high, len(other.counts)) != \
+                (self.low, self.high, len(self.counts)):
+            raise ValueError('Cannot merge histograms with different bins!')
+        self.counts = [x + y for x, y in zip(self.counts, other.counts)]
+        self.underflow += other.underflow
+        self.overflow += other.overflow
+        return self
+
+    def edges(self) -> List[float]:
+        """Edges of the bins."""
+        nbins = len(self.counts)
+        width = (self.high - self.low) / nbins
+        return [self.low + idx * width for idx in range(nbins + 1)]
+
+
+class Distribution:
+    """
+    Class for summarising the distribution of discounted payoffs in a single
+    pass with bounded memory.
+
+    All the summaries can be merged, so that distributions gathered in
+    separate chunks or processes combine into that of the whole run.
+
+    Attributes
+    ----------
+    n : int
+        Number of payoffs.
+    zeros : int
+        Number of zero payoffs.
+    knocked_out : int
+        Number of barrier paths on which the barrier left the option
+        worthless, knocked out for out options or never knocked in for in
+        options.
+    min : float
+        Smallest payoff.
+    max : float
+        Largest payoff.
+    sketch : QuantileSketch
+        Quantile sketch of the payoffs.
+    histogram : Histogram
+        Histogram of the payoffs.
+
+    Methods
+    -------
+    add(x, knocked_out)
+        Add a payoff.
+    merge(other)
+        Merge another distribution into this one.
+    quantile(q)
+        Estimate the q-quantile of the payoffs.
+    expected_shortfall(q)
+        Estimate the mean of the payoffs above the q-quantile.
+
+    Examples
+    --------
+    >>> from utils.distribution import Distribution
+    >>> dist = Distribution(low=0., high=50., nbins=10)
+    >>> for x in (0., 0., 5., 20.):
+    ...     dist.add(x)
+    >>> print(dist)
+    Distribution(n=4, zero_fraction=0.5, knockout_fraction=0.0, min=0.0,
+                 max=20.0)
+
+    """
+    __slots__ = 'n', 'zeros', 'knocked_out', 'min', 'max', 'sketch', \
+        'histogram'
+
+    def __init__(
+            self,
+            low: float = 0.,
+            high: float = 100.,
+            nbins: int = 100,
+            relative_accuracy: float = 0.01
+    ) -> None:
+        self.n: int = 0
+        self.zeros: int = 0
+        self.knocked_out: int = 0
+        self.min: float = math.inf
+        self.max: float = -math.inf
+        self.sketch = QuantileSketch(relative_accuracy)
+        self.histogram = Histogram(low, high, nbins)
+
+    def __repr__(self) -> str:
+        return (
+            f'{self.__class__.__name__}('
+            f'n={self.n!r}, '
+            f'zero_fraction={self.zero_fraction!r}, '
+            f'knockout_fraction={self.knockout_fraction!r}, '
+            f'min={self.min!r}, '
+            f'max={self.max!r}'
+            ')'
+        )
+
+    @property
+    def zero_fraction(self) -> float:
+        """Fraction of zero payoffs."""
+        return self.zeros / self.n if self.n else math.nan
+
+    @property
+    def knockout_fraction(self) -> float:
+        """Fraction of barrier paths left worthless by the barrier."""
+        return self.knocked_out / self.n if self.n else math.nan
+
+    def add(self, x: float, knocked_out: Optional[bool] = None) -> None:
+        """
+        Add a payoff.
+
+        Parameters
+        ----------
+        x : float
+            Discounted payoff.
+        knocked_out : bool, optional
+            Whether the barrier left the option worthless on this path.
+
+        """
+        self.n += 1
+        if x == 0:
+            self.zeros += 1
+        if knocked_out:
+            self.knocked_out += 1
+        self.min = min(self.min, x)
+        self.max = max(self.max, x)
+        self.sketch.add(x)
+        self.histogram.add(x)
+
+    def merge(self, other: 'Distribution') -> 'Distribution':
+        """Merge another distribution into this one."""
+        self.n += other.n
+        self.zeros += other.zeros
+        self.knocked_out += other.knocked_out
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.sketch.merge(other.sketch)
+        self.histogram.merge(other.histogram)
+        return self
+
+    def quantile(self, q: float) -> float:
+        """Estimate the q-quantile of the payoffs."""
+        if self.n == 0:
+            return math.nan
+        return min(max(self.sketch.quantile(q), self.min), self.max)
+
+    def expected_shortfall(self, q: float) -> float:
+        """Estimate the mean of the payoffs above the q-quantile."""
+        if self.n == 0:
+            return math.nan
+        return min(max(self.sketch.tail_mean(q), self.min), self.max)
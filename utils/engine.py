@@ -9,17 +9,33 @@ Pricing engine for exotic options.
 
 import math
 from statistics import mean, stdev
-from dataclasses import dataclass
-from typing import List, Sequence
+from dataclasses import dataclass, field
+from typing import Any, List, Optional, Sequence, Tuple
 
-from utils.misc import Number
-from utils.path import PathGenerator
-from utils.payoff import BasePayoff
+from utils.analytic import black_scholes
+from utils.correction import match_moments, martingale_correct
+from utils.distribution import Distribution
+from utils.enums import BarrierInOut
+from utils.misc import Number, union_grid
+from utils.path import BasePath, PathGenerator
+from utils.payoff import BasePayoff, BasketMixin, DiscreteBarrierPayOff, \
+    VanillaPayOff
 
 
 __all__ = ['MCResult', 'PricingEngine']
 
 
+def _observe(spot_prices: Sequence[Any], idx: Sequence[int]) -> List[Any]:
+    """
+    Prices of a path on a subset of its dates, for every underlying of a
+    path of several underlyings.
+
+    """
+    if spot_prices and isinstance(spot_prices[0], (int, float)):
+        return [spot_prices[x] for x in idx]
+    return [[row[x] for x in idx] for row in spot_prices]
+
+
 @dataclass
 class MCResult:
     """
@@ -31,11 +47,15 @@ class MCResult:
         Spot Price.
     path : float
         MC standard error.
+    distribution : Distribution, optional
+        Summary of the distribution of the discounted payoffs.
 
     """
-    __slots__ = ['price', 'stderr']
     price: float
     stderr: float
+    distribution: Optional[Distribution] = field(
+        default=None, repr=False, compare=False
+    )
 
 
 @dataclass
@@ -47,13 +67,18 @@ class PricingEngine:
     ----------
     payoff : BasePayoff
         Payoff object for calculating the options payoff.
-    path : PathGenerator
-        PathGenerator object for generating the evolution of the underlying.
+    path : BasePath
+        PathGenerator object for generating the evolution of the underlying,
+        or MultiPathGenerator object for several underlyings.
 
     Methods
     -------
-    price()
+    price(T)
         Price the option using MC techniques.
+    price_many(schedules)
+        Price several options on a single set of simulated paths.
+    price_corrected(T)
+        Price the option using bias corrected batches of paths.
 
     Examples
     --------
@@ -70,13 +95,15 @@ class PricingEngine:
     """
     __slots__ = 'payoff', 'path'
     payoff: BasePayoff
-    path: PathGenerator
+    path: BasePath
 
     def price(
             self,
             T: Sequence[Number],
             ntrials: int = 10_000,
-            antithetic: bool = True
+            antithetic: bool = True,
+            distribution: Optional[Distribution] = None,
+            parity: bool = True
     ) -> MCResult:
         """
         Price the option using MC techniques.
@@ -89,6 +116,19 @@ class PricingEngine:
             Number of trials to simulate.
         antithetic : bool
             Use antithetic variates technique.
+        distribution : Distribution, optional
+            Summary to which the discounted payoff of every path is added,
+            antithetic paths included, and which is attached to the result.
+            With in-out parity it summarises the knock-in payoffs as
+            simulated, before the vanilla leg is applied, so its mean differs
+            from the price.
+        parity : bool
+            Price single asset knock-in barrier options by in-out parity, as
+            the analytic vanilla option minus the knock-out option simulated
+            on the same paths, with the vanilla leg used as a control variate
+            so that the standard error accounts for their covariance. The
+            standard error falls the most when nearly every path knocks in,
+            and only by a few percent when the barrier is rarely touched.
 
         Returns
         -------
@@ -111,9 +151,17 @@ class PricingEngine:
             raise AssertionError('Number of trials cannot be less than the '
                                  'number of setting dates!')
 
+        # Discount to current time
+        df = math.exp(-self.path.discount_rate * (T[-1] - T[0]))
+
+        # Vanilla leg of in-out parity for knock-in options
+        leg = self._vanilla(T[-1] - T[0]) if parity else None
+        vanilla = None if leg is None else leg[0]
+
         # Generation start
         ntrials = int(ntrials // len(T))
         payoffs: List[float] = [0] * ntrials
+        v_payoffs: List[float] = [0] * ntrials
         for idx in range(ntrials):
             # Generate a random path
             if not antithetic:
@@ -123,18 +171,276 @@ class PricingEngine:
                 spot_prices, a_spot_prices = prices_tuple
 
             # Calculate the payoff
-            payoff = self.payoff.calculate(spot_prices)
+            payoff = self._calculate(spot_prices, df, distribution)
+            if vanilla is not None:
+                v_payoffs[idx] = vanilla.calculate(spot_prices)
             if antithetic:
-                a_po = self.payoff.calculate(a_spot_prices)
+                a_po = self._calculate(a_spot_prices, df, distribution)
                 payoff = (payoff + a_po) / 2
+                if vanilla is not None:
+                    v_payoffs[idx] += vanilla.calculate(a_spot_prices)
+                    v_payoffs[idx] /= 2
             payoffs[idx] = payoff
 
-        # Discount to current time
-        df = math.exp(-self.path.net_r * (T[-1] - T[0]))
         dis_payoffs = [x * df for x in payoffs]
+        if leg is not None:
+            dis_payoffs = self._parity(
+                dis_payoffs, [x * df for x in v_payoffs], leg[1]
+            )
 
         # Payoff expectation and standard error
         exp_payoff = mean(dis_payoffs)
         stderr = stdev(dis_payoffs, exp_payoff) / math.sqrt(ntrials)
 
+        return MCResult(exp_payoff, stderr, distribution)
+
+    def _vanilla(self, tau: float) -> Optional[Tuple[VanillaPayOff, float]]:
+        """
+        Vanilla option of the in-out parity of a knock-in option and its
+        analytic price, if it can be priced analytically.
+
+        """
+        if not isinstance(self.payoff, DiscreteBarrierPayOff) or \
+                isinstance(self.payoff, BasketMixin) or \
+                not isinstance(self.path, PathGenerator) or \
+                self.payoff.barrier_inout != BarrierInOut.In:
+            return None
+        vanilla = VanillaPayOff(K=self.payoff.K,
+                                option_right=self.payoff.option_right)
+        return vanilla, black_scholes(self.path, vanilla.K,
+                                      vanilla.option_right, tau)
+
+    @staticmethod
+    def _parity(
+            dis_payoffs: Sequence[float],
+            v_dis_payoffs: Sequence[float],
+            v_price: float
+    ) -> List[float]:
+        """
+        Combine the knock-in payoffs with the vanilla ones on the same paths.
+
+        By in-out parity the knock-in is the analytic vanilla minus the
+        knock-out, i.e. the knock-in payoff plus the error of the simulated
+        vanilla. The error is weighted by the regression coefficient of the
+        knock-in on the vanilla, which minimises the variance: a weight of
+        one is exact parity, while for rarely touched barriers, whose
+        knock-out leg is as noisy as the vanilla, the weight tends to zero.
+
+        The weight is estimated from the same paths as the payoffs, which
+        biases the price by O(1/n) and adds variance that the standard error
+        does not account for, both negligible but for few paths.
+
+        """
+        v_mean = mean(v_dis_payoffs)
+        var = sum((x - v_mean)**2 for x in v_dis_payoffs)
+        cov = sum(
+            (x - v_mean) * y for x, y in zip(v_dis_payoffs, dis_payoffs)
+        )
+        beta = cov / var if var > 0 else 0.
+        return [
+            y - beta * (x - v_price) for x, y in zip(v_dis_payoffs, dis_payoffs)
+        ]
+
+    def _calculate(
+            self,
+            spot_prices: Sequence[Number],
+            df: float,
+            distribution: Optional[Distribution]
+    ) -> float:
+        """
+        Payoff of a path, adding its discounted value to the distribution if
+        any, with the barrier evaluated once for both.
+
+        """
+        if distribution is None:
+            return self.payoff.calculate(spot_prices)
+        knocked_out = None
+        if isinstance(self.payoff, DiscreteBarrierPayOff):
+            payoff, active = self.payoff.settle(spot_prices)
+            knocked_out = not active
+        else:
+            payoff = self.payoff.calculate(spot_prices)
+        distribution.add(payoff * df, knocked_out)
+        return payoff
+
+    def price_many(
+            self,
+            schedules: Sequence[Tuple[BasePayoff, Sequence[Number]]],
+            ntrials: int = 10_000,
+            antithetic: bool = True
+    ) -> List[MCResult]:
+        """
+        Price several options on a single set of simulated paths.
+
+        The paths are simulated once on the sorted union of all the setting
+        dates and each payoff is evaluated on its own dates only. Each option
+        gets as many paths as `price` would give it alone, the first of those
+        simulated, so that sharing the simulation costs no precision. The
+        `payoff` attribute of the engine is not used.
+
+        Parameters
+        ----------
+        schedules : Sequence of (BasePayoff, Sequence of Numbers) pairs
+            Payoff objects along with their set of times {t1, t2, ..., tn} in
+            years. All sets of times must share the same start t1.
+        ntrials : int
+            Number of trials to simulate per option. As in `price`, the
+            number of paths of an option is `ntrials` divided by the number
+            of its own setting dates.
+        antithetic : bool
+            Use antithetic variates technique.
+
+        Returns
+        -------
+        List of MCResult
+            Price of each option, in the same order as `schedules`.
+
+        Examples
+        --------
+        >>> from utils.engine import PricingEngine
+        >>> from utils.path import PathGenerator
+        >>> from utils.payoff import AsianArithmeticPayOff
+        >>> path = PathGenerator(S=100., r=0.1, div=0.01, vol=0.3)
+        >>> payoff = AsianArithmeticPayOff(option_right='Call', K=110)
+        >>> engine = PricingEngine(payoff=payoff, path=path)
+        >>> monthly = [x / 12 for x in range(12 + 1)]
+        >>> quarterly = [x / 4 for x in range(4 + 1)]
+        >>> print(engine.price_many([(payoff, monthly), (payoff, quarterly)]))
+        [MCResult(price=4.470547342123249, stderr=0.19750257226682677),
+         MCResult(price=4.252825804331301, stderr=0.12172569601279974)]
+
+        """
+        T, indices = union_grid([x[1] for x in schedules])
+        if any(ntrials < len(x[1]) for x in schedules):
+            raise AssertionError('Number of trials cannot be less than the '
+                                 'number of setting dates!')
+
+        # Generation start, with the number of paths of each option as if it
+        # were priced alone
+        npaths = [int(ntrials // len(x[1])) for x in schedules]
+        payoffs: List[List[float]] = [[0] * x for x in npaths]
+        for idx in range(max(npaths)):
+            # Generate a random path on the union of all dates
+            if not antithetic:
+                spot_prices = self.path.generate(T)
+            else:
+                prices_tuple = self.path.generate_antithetic(T)
+                spot_prices, a_spot_prices = prices_tuple
+
+            # Calculate the payoffs on their own dates
+            for p_idx, (payoff_obj, _) in enumerate(schedules):
+                if idx >= npaths[p_idx]:
+                    continue
+                p_T_idx = indices[p_idx]
+                payoff = payoff_obj.calculate(_observe(spot_prices, p_T_idx))
+                if antithetic:
+                    a_po = payoff_obj.calculate(
+                        _observe(a_spot_prices, p_T_idx)
+                    )
+                    payoff = (payoff + a_po) / 2
+                payoffs[p_idx][idx] = payoff
+
+        results: List[MCResult] = []
+        for (_, p_T), p_payoffs in zip(schedules, payoffs):
+            # Discount to current time
+            df = math.exp(-self.path.discount_rate * (p_T[-1] - p_T[0]))
+            dis_payoffs = [x * df for x in p_payoffs]
+
+            # Payoff expectation and standard error
+            exp_payoff = mean(dis_payoffs)
+            stderr = stdev(dis_payoffs, exp_payoff) / \
+                math.sqrt(len(dis_payoffs))
+            results.append(MCResult(exp_payoff, stderr))
+        return results
+
+    def price_corrected(
+            self,
+            T: Sequence[Number],
+            ntrials: int = 10_000,
+            antithetic: bool = True,
+            moment_matching: bool = True,
+            martingale: bool = True,
+            nbatches: int = 10
+    ) -> MCResult:
+        """
+        Price the option using bias corrected batches of paths.
+
+        The paths are simulated in independent batches and each batch is
+        post-processed as a whole. Since the corrected paths within a batch
+        are no longer independent, the standard error is estimated from the
+        spread of the batch prices.
+
+        Parameters
+        ----------
+        T : Sequence of Numbers
+            Set of times {t1, t2, ..., tn} in years.
+        ntrials : int
+            Number of trials to simulate.
+        antithetic : bool
+            Use antithetic variates technique.
+        moment_matching : bool
+            Match the sample mean and variance of the log increments on every
+            step to the theoretical ones.
+        martingale : bool
+            Make the discounted spot price an exact martingale on every date.
+        nbatches : int
+            Number of independent batches.
+
+        Returns
+        -------
+        MCResult
+            Price of the option.
+
+        Examples
+        --------
+        >>> from utils.engine import PricingEngine
+        >>> from utils.path import PathGenerator
+        >>> from utils.payoff import AsianArithmeticPayOff
+        >>> path = PathGenerator(S=100., r=0.1, div=0.01, vol=0.3)
+        >>> payoff = AsianArithmeticPayOff(option_right='Call', K=110)
+        >>> engine = PricingEngine(payoff=payoff, path=path)
+        >>> print(engine.price_corrected(T=range(4)))
+        MCResult(price=12.160964379514166, stderr=0.09886682221230042)
+
+        """
+        if not isinstance(self.path, PathGenerator):
+            raise TypeError('Bias corrected paths require a PathGenerator, '
+                            f'instead got type {type(self.path)}!')
+        if ntrials < len(T):
+            raise AssertionError('Number of trials cannot be less than the '
+                                 'number of setting dates!')
+        ntrials = int(ntrials // len(T))
+        if nbatches < 2 or ntrials < 2 * nbatches:
+            raise AssertionError('At least two batches of two paths are '
+                                 'required!')
+
+        # Discount to current time
+        df = math.exp(-self.path.discount_rate * (T[-1] - T[0]))
+
+        batch_prices: List[float] = [0] * nbatches
+        for b_idx in range(nbatches):
+            # Generate a batch of paths, antithetic pairs next to each other
+            npaths = ntrials // nbatches + (b_idx < ntrials % nbatches)
+            paths: List[List[float]] = []
+            for _ in range(npaths):
+                if not antithetic:
+                    paths.append(self.path.generate(T))
+                else:
+                    paths.extend(self.path.generate_antithetic(T))
+
+            # Post-process the batch
+            if moment_matching:
+                paths = match_moments(paths, self.path, T)
+            if martingale:
+                paths = martingale_correct(paths, self.path, T)
+
+            # Payoff expectation of the batch
+            batch_prices[b_idx] = df * mean(
+                self.payoff.calculate(x) for x in paths
+            )
+
+        # Payoff expectation and standard error over the batches
+        exp_payoff = mean(batch_prices)
+        stderr = stdev(batch_prices, exp_payoff) / math.sqrt(nbatches)
+
         return MCResult(exp_payoff, stderr)
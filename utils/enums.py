@@ -10,7 +10,7 @@ Enumeration utility classes.
 from enum import Enum, auto
 
 
-__all__ = ['OptionRight', 'BarrierUpDown', 'BarrierInOut']
+__all__ = ['OptionRight', 'BarrierUpDown', 'BarrierInOut', 'BasketType']
 
 
 class PPEnum(Enum):
@@ -39,3 +39,10 @@ class BarrierInOut(PPEnum):
     """In or out type barrier option."""
     In: int = auto()
     Out: int = auto()
+
+
+class BasketType(PPEnum):
+    """How the prices of several underlyings are combined."""
+    Basket = auto()
+    BestOf = auto()
+    WorstOf = auto()
@@ -0,0 +1,247 @@
+# author : S. Mandalia
+#          shivesh.mandalia@outlook.com
+#
+# date   : October 18, 2026
+
+"""
+Checkpointed pricing jobs which can resume after a crash.
+"""
+
+import json
+import os
+import random
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
+
+from utils.engine import MCResult
+from utils.plan import SimulationPlan
+from utils.stats import Moments
+
+
+__all__ = ['Job', 'JobRunner']
+
+
+@dataclass
+class Job:
+    """
+    Pricing job for a single trade.
+
+    Attributes
+    ----------
+    name : str
+        Unique name of the trade.
+    plan : SimulationPlan
+        Simulation plan for the trade.
+    ntrials : int
+        Number of trials to simulate.
+
+    """
+    __slots__ = ['name', 'plan', 'ntrials']
+    name: str
+    plan: SimulationPlan
+    ntrials: int
+
+    @property
+    def npaths(self) -> int:
+        """Number of paths, or antithetic pairs of paths, to simulate."""
+        return int(self.ntrials // len(self.plan.T))
+
+
+class JobRunner:
+    """
+    Class for running pricing jobs, periodically saving their progress to a
+    journal file.
+
+    For every job the journal holds the accumulated moments, the number of
+    paths simulated and the state of its random number generator. After a
+    restart, completed jobs are skipped and the others resume exactly where
+    they left off, giving the same result as an uninterrupted run.
+
+    Attributes
+    ----------
+    journal : str
+        Path to the journal file.
+    chunk : int
+        Number of paths simulated between checks for a checkpoint.
+    interval : float
+        Minimum time in seconds between checkpoints of a job.
+
+    Methods
+    -------
+    run(jobs)
+        Run the jobs, resuming from the journal.
+
+    Examples
+    --------
+    >>> from utils.jobs import JobRunner
+    >>> runner = JobRunner('book.journal')
+    >>> print(runner)
+    JobRunner(journal='book.journal', chunk=1000, interval=60.0)
+
+    """
+    __slots__ = 'journal', 'chunk', 'interval'
+
+    def __init__(
+            self, journal: str, chunk: int = 1_000, interval: float = 60.
+    ) -> None:
+        if chunk < 1:
+            raise ValueError(f'Invalid chunk {chunk}, expected >= 1')
+        self.journal: str = journal
+        self.chunk: int = chunk
+        self.interval: float = interval
+
+    def __repr__(self) -> str:
+        return (
+            f'{self.__class__.__name__}('
+            f'journal={self.journal!r}, '
+            f'chunk={self.chunk!r}, '
+            f'interval={self.interval!r}'
+            ')'
+        )
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """Latest record of every job in the journal."""
+        records: Dict[str, Dict[str, Any]] = {}
+        if not os.path.exists(self.journal):
+            return records
+        with open(self.journal) as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # Partly written record from a crash
+                    continue
+                records[record['name']] = record
+        return records
+
+    def _compact(self, records: Dict[str, Dict[str, Any]]) -> None:
+        """Atomically rewrite the journal with the latest records only."""
+        tmp = self.journal + '.tmp'
+        with open(tmp, 'w') as f:
+            for record in records.values():
+                f.write(json.dumps(record) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.journal)
+
+    @staticmethod
+    def _record(
+            job: Job, moments: Moments, done: int, rng: random.Random
+    ) -> Dict[str, Any]:
+        """Journal record of the progress of a job."""
+        version, internal, gauss_next = rng.getstate()
+        return {
+            'name': job.name,
+            'plan': repr(job.plan),
+            'ntrials': job.ntrials,
+            'done': done,
+            'n': moments.n,
+            'mean': moments.mean,
+            'm2': moments.m2,
+            'rng': [version, list(internal), gauss_next],
+        }
+
+    def _run_job(
+            self,
+            job: Job,
+            record: Optional[Dict[str, Any]],
+            seed: Optional[int],
+            f: Any
+    ) -> MCResult:
+        """Run a single job, appending checkpoints to the open journal."""
+        if record is not None:
+            if record['plan'] != repr(job.plan) or \
+                    record['ntrials'] != job.ntrials:
+                raise ValueError(f'Job {job.name} does not match its journal '
+                                 'record!')
+            moments = Moments(record['n'], record['mean'], record['m2'])
+            done = record['done']
+            version, internal, gauss_next = record['rng']
+            rng = random.Random()
+            rng.setstate((version, tuple(internal), gauss_next))
+        else:
+            moments = Moments()
+            done = 0
+            rng = random.Random(f'{seed}:{job.name}' if seed is not None
+                                else None)
+
+        last = time.monotonic()
+        while done < job.npaths:
+            npaths = min(self.chunk, job.npaths - done)
+            moments.merge(job.plan.simulate(npaths, rng))
+            done += npaths
+            if done == job.npaths or time.monotonic() - last >= self.interval:
+                record = self._record(job, moments, done, rng)
+                f.write(json.dumps(record) + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+                last = time.monotonic()
+        return moments.result()
+
+    def run(
+            self, jobs: Sequence[Job], seed: Optional[int] = None
+    ) -> Dict[str, MCResult]:
+        """
+        Run the jobs, resuming from the journal.
+
+        Parameters
+        ----------
+        jobs : Sequence of Job
+            Jobs to run.
+        seed : int, optional
+            Seed from which the random number generator of each job is
+            derived, using its name. Entropy from the system if None; the
+            state is journaled either way.
+
+        Returns
+        -------
+        Dict of str to MCResult
+            Price of every trade.
+
+        Examples
+        --------
+        >>> import os
+        >>> import tempfile
+        >>> from utils.jobs import Job, JobRunner
+        >>> from utils.path import PathGenerator
+        >>> from utils.payoff import AsianArithmeticPayOff
+        >>> from utils.plan import SimulationPlan
+        >>> path = PathGenerator(S=100., r=0.1, div=0.01, vol=0.3)
+        >>> payoff = AsianArithmeticPayOff(option_right='Call', K=110)
+        >>> plan = SimulationPlan(path, T=range(4), payoff=payoff)
+        >>> with tempfile.TemporaryDirectory() as tmp:
+        ...     runner = JobRunner(os.path.join(tmp, 'book.journal'))
+        ...     print(runner.run([Job('asian', plan, ntrials=10_000)], seed=1))
+        {'asian': MCResult(price=11.836817238621343, stderr=0.22978460529269226)}
+
+        """
+        names = [x.name for x in jobs]
+        if len(set(names)) != len(names):
+            raise ValueError('Job names must be unique!')
+
+        # Compact even without records, dropping any partly written line
+        # which the new records would otherwise be appended to
+        records = self._load()
+        if os.path.exists(self.journal):
+            self._compact(records)
+
+        results: Dict[str, MCResult] = {}
+        pending: List[Job] = []
+        for job in jobs:
+            record = records.get(job.name)
+            if record is not None and record['done'] == job.npaths and \
+                    record['plan'] == repr(job.plan) and \
+                    record['ntrials'] == job.ntrials:
+                # Already complete
+                moments = Moments(record['n'], record['mean'], record['m2'])
+                results[job.name] = moments.result()
+            else:
+                pending.append(job)
+
+        with open(self.journal, 'a') as f:
+            for job in pending:
+                results[job.name] = self._run_job(
+                    job, records.get(job.name), seed, f
+                )
+        return {x: results[x] for x in names}
@@ -0,0 +1,204 @@
+# author : S. Mandalia
+#          shivesh.mandalia@outlook.com
+#
+# date   : October 18, 2026
+
+"""
+Strike ladder for pricing many vanilla options on one set of paths.
+"""
+
+import math
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+from typing import List, Sequence
+
+from utils.engine import MCResult
+from utils.enums import OptionRight
+from utils.misc import Number
+from utils.path import PathGenerator
+from utils.payoff import VanillaPayOff
+
+
+__all__ = ['StrikeLadder']
+
+
+class StrikeLadder:
+    """
+    Class for pricing vanilla options of any strike from a single set of
+    simulated terminal prices.
+
+    The terminal prices are sorted once and prefix sums of S and S² are
+    stored, so that each option is priced with a binary search.
+
+    Attributes
+    ----------
+    df : float
+        Discount factor to current time.
+    ntrials : int
+        Number of simulated terminal prices.
+
+    Methods
+    -------
+    simulate(path, T)
+        Simulate the terminal prices and build the ladder.
+    price(payoff)
+        Price a vanilla option.
+
+    Examples
+    --------
+    >>> from utils.ladder import StrikeLadder
+    >>> ladder = StrikeLadder([90., 100., 110., 120.], df=1.)
+    >>> print(ladder)
+    StrikeLadder(ntrials=4, df=1.0)
+
+    """
+    __slots__ = 'df', '_S', '_sum', '_sum_sq'
+
+    def __init__(self, S: Sequence[Number], df: float = 1.) -> None:
+        if len(S) < 2:
+            raise AssertionError('At least two terminal prices are required!')
+        self.df: float = df
+        self._S: List[float] = sorted(float(x) for x in S)
+        self._sum: List[float] = [0.] + list(accumulate(self._S))
+        self._sum_sq: List[float] = [0.] + list(
+            accumulate(x**2 for x in self._S)
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f'{self.__class__.__name__}('
+            f'ntrials={self.ntrials!r}, '
+            f'df={self.df!r}'
+            ')'
+        )
+
+    @property
+    def ntrials(self) -> int:
+        """Number of simulated terminal prices."""
+        return len(self._S)
+
+    @classmethod
+    def simulate(
+            cls,
+            path: PathGenerator,
+            T: Sequence[Number],
+            ntrials: int = 10_000,
+            antithetic: bool = True
+    ) -> 'StrikeLadder':
+        """
+        Simulate the terminal prices and build the ladder.
+
+        Parameters
+        ----------
+        path : PathGenerator
+            PathGenerator object for generating the evolution of the
+            underlying.
+        T : Sequence of Numbers
+            Set of times {t1, t2, ..., tn} in years.
+        ntrials : int
+            Number of trials to simulate.
+        antithetic : bool
+            Use antithetic variates technique.
+
+        Returns
+        -------
+        StrikeLadder
+
+        Notes
+        -----
+        As in `PricingEngine.price`, `ntrials` is shared among the setting
+        dates, so that the number of paths matches that of the engine. Only
+        the final date is simulated as the payoff depends on it alone.
+
+        Examples
+        --------
+        >>> from utils.ladder import StrikeLadder
+        >>> from utils.path import PathGenerator
+        >>> from utils.payoff import VanillaPayOff
+        >>> path = PathGenerator(S=100., r=0.1, div=0.01, vol=0.3)
+        >>> ladder = StrikeLadder.simulate(path, T=[0, 1])
+        >>> for K in (90, 100, 110):
+        ...     print(ladder.price(VanillaPayOff(option_right='Call', K=K)))
+        MCResult(price=21.825618198358185, stderr=0.2588486781070479)
+        MCResult(price=16.098205834707418, stderr=0.23290953595819652)
+        MCResult(price=11.570703526641054, stderr=0.20412422181853998)
+
+        """
+        if ntrials < len(T):
+            raise AssertionError('Number of trials cannot be less than the '
+                                 'number of setting dates!')
+
+        # Generation start
+        ntrials = int(ntrials // len(T))
+        T_terminal = [T[0], T[-1]]
+        S: List[float] = []
+        for _ in range(ntrials):
+            if not antithetic:
+                S.append(path.generate(T_terminal)[-1])
+            else:
+                spot_prices, a_spot_prices = path.generate_antithetic(
+                    T_terminal
+                )
+                S.extend((spot_prices[-1], a_spot_prices[-1]))
+
+        # Discount to current time
+        df = math.exp(-path.discount_rate * (T[-1] - T[0]))
+        return cls(S, df)
+
+    def price(self, payoff: VanillaPayOff) -> MCResult:
+        """
+        Price a vanilla option.
+
+        Parameters
+        ----------
+        payoff : VanillaPayOff
+            Payoff object for the option.
+
+        Returns
+        -------
+        MCResult
+            Price of the option.
+
+        Notes
+        -----
+        Every terminal price is treated as an independent sample. For
+        antithetic pairs the covariance of a monotone payoff is non-positive,
+        so the reported standard error is an upper bound.
+
+        Examples
+        --------
+        >>> from utils.ladder import StrikeLadder
+        >>> from utils.payoff import VanillaPayOff
+        >>> ladder = StrikeLadder([90., 100., 110., 120.], df=1.)
+        >>> print(ladder.price(VanillaPayOff(option_right='Call', K=105)))
+        MCResult(price=5.0, stderr=3.5355339059327378)
+
+        """
+        if not isinstance(payoff, VanillaPayOff):
+            raise TypeError(
+                f'Expected VanillaPayOff, instead got type {type(payoff)}!'
+            )
+        K = payoff.K
+        n = self.ntrials
+        total, total_sq = self._sum[-1], self._sum_sq[-1]
+
+        # Sum of payoffs and of squared payoffs for the in the money prices
+        if payoff.option_right == OptionRight.Call:
+            idx = bisect_right(self._S, K)
+            m = n - idx
+            s1 = total - self._sum[idx]
+            s2 = total_sq - self._sum_sq[idx]
+            po_sum = s1 - K * m
+            po_sum_sq = s2 - 2 * K * s1 + K**2 * m
+        else:
+            idx = bisect_left(self._S, K)
+            s1 = self._sum[idx]
+            s2 = self._sum_sq[idx]
+            po_sum = K * idx - s1
+            po_sum_sq = K**2 * idx - 2 * K * s1 + s2
+
+        # Payoff expectation and standard error
+        exp_payoff = po_sum / n
+        var = max(po_sum_sq - n * exp_payoff**2, 0.) / (n - 1)
+        stderr = self.df * math.sqrt(var / n)
+        return MCResult(self.df * exp_payoff, stderr)
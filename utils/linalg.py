@@ -0,0 +1,126 @@
+# author : S. Mandalia
+#          shivesh.mandalia@outlook.com
+#
+# date   : October 18, 2026
+
+"""
+Linear algebra utility methods.
+"""
+
+import math
+from typing import List, Sequence, Tuple
+
+
+__all__ = ['Matrix', 'cholesky', 'eigh']
+
+
+Matrix = List[List[float]]
+
+
+def cholesky(A: Sequence[Sequence[float]]) -> Matrix:
+    """
+    Cholesky factorisation A = L Lᵀ of a symmetric positive definite matrix.
+
+    Parameters
+    ----------
+    A : Sequence of Sequences of floats
+        Symmetric positive definite matrix.
+
+    Returns
+    -------
+    L : List of Lists of floats
+        Lower triangular matrix.
+
+    Examples
+    --------
+    >>> from utils.linalg import cholesky
+    >>> print(cholesky([[1., 0.5], [0.5, 1.]]))
+    [[1.0, 0.0], [0.5, 0.8660254037844386]]
+
+    """
+    n = len(A)
+    L = [[0.] * n for _ in range(n)]
+    for row in range(n):
+        for col in range(row + 1):
+            s = sum(L[row][k] * L[col][k] for k in range(col))
+            if row == col:
+                diag = A[row][row] - s
+                if diag <= 0:
+                    raise ValueError('Matrix is not positive definite!')
+                L[row][col] = math.sqrt(diag)
+            else:
+                L[row][col] = (A[row][col] - s) / L[col][col]
+    return L
+
+
+def eigh(
+        A: Sequence[Sequence[float]],
+        tol: float = 1e-12,
+        max_sweeps: int = 100
+) -> Tuple[List[float], Matrix]:
+    """
+    Eigendecomposition of a symmetric matrix by the cyclic Jacobi method.
+
+    Parameters
+    ----------
+    A : Sequence of Sequences of floats
+        Symmetric matrix.
+    tol : float
+        Tolerance on the off-diagonal elements, relative to the matrix norm.
+    max_sweeps : int
+        Maximum number of sweeps over the off-diagonal elements.
+
+    Returns
+    -------
+    w : List of floats
+        Eigenvalues in decreasing order.
+    V : List of Lists of floats
+        Eigenvectors, column `i` corresponds to eigenvalue `w[i]`.
+
+    Examples
+    --------
+    >>> from utils.linalg import eigh
+    >>> print(eigh([[1., 0.5], [0.5, 1.]]))
+    ([1.4999999999999998, 0.4999999999999999],
+     [[0.7071067811865475, 0.7071067811865475],
+      [0.7071067811865475, -0.7071067811865475]])
+
+    """
+    n = len(A)
+    M = [[float(x) for x in row] for row in A]
+    V = [[float(row == col) for col in range(n)] for row in range(n)]
+    norm = math.sqrt(sum(x**2 for row in M for x in row)) or 1.
+    for _ in range(max_sweeps):
+        off = math.sqrt(sum(
+            M[p][q]**2 for p in range(n) for q in range(n) if p != q
+        ))
+        if off <= tol * norm:
+            break
+        for p in range(n - 1):
+            for q in range(p + 1, n):
+                if M[p][q] == 0:
+                    continue
+                # Rotation angle zeroing M[p][q]
+                theta = (M[q][q] - M[p][p]) / (2 * M[p][q])
+                t = math.copysign(1., theta) / (
+                    abs(theta) + math.sqrt(theta**2 + 1)
+                )
+                c = 1 / math.sqrt(t**2 + 1)
+                s = t * c
+                for k in range(n):
+                    Mkp, Mkq = M[k][p], M[k][q]
+                    M[k][p] = c * Mkp - s * Mkq
+                    M[k][q] = s * Mkp + c * Mkq
+                for k in range(n):
+                    Mpk, Mqk = M[p][k], M[q][k]
+                    M[p][k] = c * Mpk - s * Mqk
+                    M[q][k] = s * Mpk + c * Mqk
+                for k in range(n):
+                    Vkp, Vkq = V[k][p], V[k][q]
+                    V[k][p] = c * Vkp - s * Vkq
+                    V[k][q] = s * Vkp + c * Vkq
+
+    order = sorted(range(n), key=lambda x: M[x][x], reverse=True)
+    w = [M[idx][idx] for idx in order]
+    V = [[row[idx] for idx in order] for row in V]
+    return w, V
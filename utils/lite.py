@@ -0,0 +1,240 @@
+# author : S. Mandalia
+#          shivesh.mandalia@outlook.com
+#
+# date   : October 18, 2026
+
+"""
+Lightweight pricing entry point for short-lived processes.
+
+Importing this module only loads the small `__future__` module besides those
+which are already loaded when the interpreter starts, the pricing modules are
+imported on first use, or ahead of time by a pre-forked worker. Options are
+described by plain values, so that jobs can be passed between processes
+without importing the pricing modules or a serialisation library.
+"""
+
+from __future__ import annotations
+
+import builtins
+import marshal
+import os
+
+# Importing typing alone takes longer than the rest of this module, so it is
+# only imported by type checkers
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any, BinaryIO, Dict, Optional, Tuple
+
+
+__all__ = ['price', 'warm', 'Worker']
+
+
+# Payoffs with a compiled simulation plan
+_PAYOFFS = ('VanillaPayOff', 'AsianArithmeticPayOff', 'DiscreteBarrierPayOff')
+
+# Keys of a job describing the underlying and the run, the others are passed
+# to the payoff
+_PATH_KEYS = ('S', 'r', 'div', 'vol')
+_RUN_KEYS = ('payoff', 'T', 'ntrials', 'antithetic', 'seed')
+
+
+def price(job: Dict[str, Any]) -> Tuple[float, float]:
+    """
+    Price an option described by plain values.
+
+    Parameters
+    ----------
+    job : Dict of str to objects
+        Description of the option, with the name of the payoff class under
+        'payoff' along with its arguments, the arguments of the
+        PathGenerator, the setting dates 'T', and optionally 'ntrials',
+        'antithetic' and 'seed' as in `SimulationPlan`. As there, knock-in
+        options are simulated directly, without in-out parity.
+
+    Returns
+    -------
+    price : float
+        Price of the option.
+    stderr : float
+        MC standard error of the price.
+
+    Examples
+    --------
+    >>> from utils.lite import price
+    >>> job = {'payoff': 'AsianArithmeticPayOff', 'option_right': 'Call',
+    ...        'K': 110, 'S': 100., 'r': 0.1, 'div': 0.01, 'vol': 0.3,
+    ...        'T': [0, 1, 2, 3], 'seed': 1}
+    >>> print(price(job))
+    (11.930703888794639, 0.23640557152783467)
+
+    """
+    # Imported on first use
+    from utils import payoff as payoff_module
+    from utils.path import PathGenerator
+    from utils.plan import SimulationPlan
+
+    if job.get('payoff') not in _PAYOFFS:
+        raise ValueError(f'Invalid payoff {job.get("payoff")}, expected one '
+                         f'of {_PAYOFFS}')
+    payoff = getattr(payoff_module, job['payoff'])(**{
+        key: value for key, value in job.items()
+        if key not in _PATH_KEYS + _RUN_KEYS
+    })
+    path = PathGenerator(*(job[key] for key in _PATH_KEYS))
+    plan = SimulationPlan(path, job['T'], payoff, job.get('antithetic', True))
+    result = plan.run(job.get('ntrials', 10_000), seed=job.get('seed'))
+    return result.price, result.stderr
+
+
+def warm() -> None:
+    """Import the pricing modules by pricing a tiny option."""
+    price({
+        'payoff': 'VanillaPayOff', 'option_right': 'Call', 'K': 100.,
+        'S': 100., 'r': 0., 'div': 0., 'vol': 0.1, 'T': [0, 1],
+        'ntrials': 2, 'seed': 0
+    })
+
+
+def _send(f: BinaryIO, obj: Any) -> None:
+    """Write a length prefixed message to a pipe."""
+    data = marshal.dumps(obj)
+    f.write(len(data).to_bytes(8, 'little') + data)
+    f.flush()
+
+
+def _recv(f: BinaryIO) -> Any:
+    """Read a length prefixed message from a pipe."""
+    header = f.read(8)
+    if len(header) < 8:
+        raise EOFError('Pipe was closed!')
+    return marshal.loads(f.read(int.from_bytes(header, 'little')))
+
+
+def _serve(jobs: BinaryIO, results: BinaryIO) -> None:
+    """Price jobs from a pipe until it is closed, in the worker process."""
+    warm()
+    while True:
+        try:
+            job = _recv(jobs)
+        except EOFError:
+            return
+        if job is None:
+            return
+        try:
+            _send(results, ('ok', price(job)))
+        except Exception as err:
+            _send(results, ('error', (type(err).__name__, str(err))))
+
+
+class Worker:
+    """
+    Class for pricing jobs in a pre-forked, warmed up worker process.
+
+    The worker is forked on creation and imports the pricing modules while
+    the parent carries on, so that only the first job may wait on them. Jobs
+    and results are exchanged over pipes with `marshal`, which is built into
+    the interpreter, and must be made of plain values.
+
+    Attributes
+    ----------
+    pid : int
+        Process ID of the worker.
+
+    Methods
+    -------
+    price(job)
+        Price an option in the worker.
+    close()
+        Stop the worker.
+
+    Notes
+    -----
+    Requires `os.fork`, so is only available on POSIX systems. The parent
+    should not have started any threads before creating the worker.
+
+    Examples
+    --------
+    >>> from utils.lite import Worker
+    >>> job = {'payoff': 'AsianArithmeticPayOff', 'option_right': 'Call',
+    ...        'K': 110, 'S': 100., 'r': 0.1, 'div': 0.01, 'vol': 0.3,
+    ...        'T': [0, 1, 2, 3], 'seed': 1}
+    >>> with Worker() as worker:
+    ...     print(worker.price(job))
+    (11.930703888794639, 0.23640557152783467)
+
+    """
+    __slots__ = 'pid', '_jobs', '_results'
+
+    def __init__(self) -> None:
+        if not hasattr(os, 'fork'):
+            raise OSError('Forking a worker is not supported on this '
+                          'platform!')
+        job_r, job_w = os.pipe()
+        result_r, result_w = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(job_w)
+            os.close(result_r)
+            try:
+                _serve(os.fdopen(job_r, 'rb'), os.fdopen(result_w, 'wb'))
+            finally:
+                # Never return into the code of the parent
+                os._exit(0)
+
+        os.close(job_r)
+        os.close(result_w)
+        self.pid: int = pid
+        self._jobs: Optional[BinaryIO] = os.fdopen(job_w, 'wb')
+        self._results: Optional[BinaryIO] = os.fdopen(result_r, 'rb')
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(pid={self.pid!r})'
+
+    def __enter__(self) -> Worker:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def price(self, job: Dict[str, Any]) -> Tuple[float, float]:
+        """
+        Price an option in the worker.
+
+        Parameters
+        ----------
+        job : Dict of str to objects
+            Description of the option, as in `price`.
+
+        Returns
+        -------
+        price : float
+            Price of the option.
+        stderr : float
+            MC standard error of the price.
+
+        """
+        if self._jobs is None or self._results is None:
+            raise ValueError('Worker is closed!')
+        _send(self._jobs, job)
+        status, value = _recv(self._results)
+        if status == 'error':
+            # Raise built-in exceptions as themselves
+            name, message = value
+            exc = getattr(builtins, name, None)
+            if not isinstance(exc, type) or not issubclass(exc, Exception):
+                exc = RuntimeError
+            raise exc(message)
+        return tuple(value)
+
+    def close(self) -> None:
+        """Stop the worker."""
+        if self._jobs is None or self._results is None:
+            return
+        try:
+            _send(self._jobs, None)
+        except BrokenPipeError:
+            pass
+        self._jobs.close()
+        self._results.close()
+        self._jobs = self._results = None
+        os.waitpid(self.pid, 0)
@@ -0,0 +1,270 @@
+# author : S. Mandalia
+#          shivesh.mandalia@outlook.com
+#
+# date   : October 18, 2026
+
+"""
+Longstaff-Schwartz pricing engine for Bermudan options.
+"""
+
+import math
+from statistics import mean, stdev
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+from utils.engine import MCResult
+from utils.misc import Number
+from utils.path import PathGenerator
+from utils.payoff import VanillaPayOff
+
+
+__all__ = ['BermudanEngine']
+
+
+def _basis(x: float, degree: int) -> List[float]:
+    """Polynomial basis functions {1, x, x², ..., x^degree}."""
+    return [x**k for k in range(degree + 1)]
+
+
+def _solve(A: List[List[float]], b: List[float]) -> List[float]:
+    """
+    Solve the linear system A x = b by Gaussian elimination with partial
+    pivoting. Degenerate directions are given a zero coefficient.
+
+    """
+    n = len(b)
+    M = [row[:] + [b[idx]] for idx, row in enumerate(A)]
+    scale = max(abs(M[idx][idx]) for idx in range(n)) or 1.
+    pivots: List[Optional[int]] = [None] * n
+    row = 0
+    for col in range(n):
+        # Find the pivot
+        p_row = max(range(row, n), key=lambda x: abs(M[x][col]), default=row)
+        if row == n or abs(M[p_row][col]) < 1e-12 * scale:
+            continue
+        M[row], M[p_row] = M[p_row], M[row]
+        pivots[col] = row
+
+        # Eliminate the column from the other rows
+        for idx in range(n):
+            if idx != row and M[idx][col] != 0:
+                factor = M[idx][col] / M[row][col]
+                M[idx] = [x - factor * y for x, y in zip(M[idx], M[row])]
+        row += 1
+
+    return [
+        M[p_row][n] / M[p_row][col] if p_row is not None else 0.
+        for col, p_row in enumerate(pivots)
+    ]
+
+
+@dataclass
+class BermudanEngine:
+    """
+    Class for pricing Bermudan options using the Longstaff-Schwartz
+    regression technique.
+
+    Exercise is allowed on every setting date except the first one. The
+    exercise value on a given date is the payoff of the spot price on that
+    date. Only vanilla payoffs are supported, since the continuation value is
+    regressed on the spot price alone, whereas for path dependent payoffs it
+    also depends on the running average or the state of the barrier.
+
+    Attributes
+    ----------
+    payoff : VanillaPayOff
+        Payoff object for calculating the options payoff.
+    path : PathGenerator
+        PathGenerator object for generating the evolution of the underlying.
+
+    Methods
+    -------
+    price(T)
+        Price the option using the Longstaff-Schwartz technique.
+
+    Examples
+    --------
+    >>> from utils.lsm import BermudanEngine
+    >>> from utils.path import PathGenerator
+    >>> from utils.payoff import VanillaPayOff
+    >>> path = PathGenerator(S=100., r=0.1, div=0.01, vol=0.3)
+    >>> payoff = VanillaPayOff(option_right='Put', K=110)
+    >>> engine = BermudanEngine(payoff=payoff, path=path)
+    >>> print(engine)
+    BermudanEngine(payoff=VanillaPayOff(K=110, option_right=Put),
+                   path=PathGenerator(S=100.0, r=0.1, div=0.01, vol=0.3))
+
+    """
+    __slots__ = 'payoff', 'path'
+    payoff: VanillaPayOff
+    path: PathGenerator
+
+    def _generate(
+            self, T: Sequence[Number], npaths: int, antithetic: bool
+    ) -> List[List[float]]:
+        """Generate paths, with antithetic pairs next to each other."""
+        paths: List[List[float]] = []
+        for _ in range(npaths):
+            if not antithetic:
+                paths.append(self.path.generate(T))
+            else:
+                paths.extend(self.path.generate_antithetic(T))
+        return paths
+
+    def _regress(
+            self,
+            T: Sequence[Number],
+            paths: List[List[float]],
+            degree: int
+    ) -> Tuple[List[float], List[Optional[List[float]]]]:
+        """
+        Backward induction, returning the discounted values of each path and
+        the regression coefficients of the continuation value on each date.
+
+        """
+        ndates = len(T)
+        nbasis = degree + 1
+        coeffs: List[Optional[List[float]]] = [None] * ndates
+
+        # Cash flows at maturity
+        values = [self.payoff.calculate(x) for x in paths]
+        for t_idx in range(ndates - 2, 0, -1):
+            # Discount the cash flows to this date
+            df = math.exp(-self.path.discount_rate * (T[t_idx + 1] - T[t_idx]))
+            values = [x * df for x in values]
+
+            # Exercise values, regression uses in the money paths only
+            exercise = [self.payoff.calculate(x[:t_idx + 1]) for x in paths]
+            itm = [idx for idx, x in enumerate(exercise) if x > 0]
+            if len(itm) < nbasis:
+                continue
+
+            # One least squares solve for all the paths on this date
+            A = [[0.] * nbasis for _ in range(nbasis)]
+            b = [0.] * nbasis
+            for idx in itm:
+                phi = _basis(paths[idx][t_idx] / self.path.S, degree)
+                for row in range(nbasis):
+                    b[row] += phi[row] * values[idx]
+                    for col in range(nbasis):
+                        A[row][col] += phi[row] * phi[col]
+            beta = _solve(A, b)
+            coeffs[t_idx] = beta
+
+            # Exercise where it is worth more than continuing
+            for idx in itm:
+                phi = _basis(paths[idx][t_idx] / self.path.S, degree)
+                cont = sum(x * y for x, y in zip(beta, phi))
+                if exercise[idx] > cont:
+                    values[idx] = exercise[idx]
+
+        # Discount to current time
+        df = math.exp(-self.path.discount_rate * (T[1] - T[0]))
+        values = [x * df for x in values]
+        return values, coeffs
+
+    def _exercise(
+            self,
+            T: Sequence[Number],
+            paths: List[List[float]],
+            coeffs: List[Optional[List[float]]],
+            degree: int
+    ) -> List[float]:
+        """Discounted values of each path under a fixed exercise rule."""
+        ndates = len(T)
+        values: List[float] = [0] * len(paths)
+        for p_idx, spot_prices in enumerate(paths):
+            t_ex = ndates - 1
+            value = self.payoff.calculate(spot_prices)
+            for t_idx in range(1, ndates - 1):
+                beta = coeffs[t_idx]
+                if beta is None:
+                    continue
+                ex = self.payoff.calculate(spot_prices[:t_idx + 1])
+                if ex <= 0:
+                    continue
+                phi = _basis(spot_prices[t_idx] / self.path.S, degree)
+                cont = sum(x * y for x, y in zip(beta, phi))
+                if ex > cont:
+                    t_ex, value = t_idx, ex
+                    break
+            df = math.exp(-self.path.discount_rate * (T[t_ex] - T[0]))
+            values[p_idx] = value * df
+        return values
+
+    def price(
+            self,
+            T: Sequence[Number],
+            ntrials: int = 10_000,
+            antithetic: bool = True,
+            degree: int = 2,
+            independent: bool = False
+    ) -> MCResult:
+        """
+        Price the option using the Longstaff-Schwartz technique.
+
+        Parameters
+        ----------
+        T : Sequence of Numbers
+            Set of times {t1, t2, ..., tn} in years.
+        ntrials : int
+            Number of trials to simulate.
+        antithetic : bool
+            Use antithetic variates technique.
+        degree : int
+            Degree of the polynomial in the spot price used to regress the
+            continuation value.
+        independent : bool
+            Price on an independent set of paths using the exercise rule
+            found by the regression. This gives a low-biased price, whereas
+            the in-sample price is typically high-biased.
+
+        Returns
+        -------
+        MCResult
+            Price of the option.
+
+        Examples
+        --------
+        >>> from utils.lsm import BermudanEngine
+        >>> from utils.path import PathGenerator
+        >>> from utils.payoff import VanillaPayOff
+        >>> path = PathGenerator(S=100., r=0.1, div=0.01, vol=0.3)
+        >>> payoff = VanillaPayOff(option_right='Put', K=110)
+        >>> engine = BermudanEngine(payoff=payoff, path=path)
+        >>> print(engine.price(T=[x / 4 for x in range(4 + 1)]))
+        MCResult(price=13.819864336138288, stderr=0.10787876133544673)
+
+        """
+        if type(self.payoff) is not VanillaPayOff:
+            raise TypeError('Expected VanillaPayOff, instead got type '
+                            f'{type(self.payoff)}!')
+        if ntrials < len(T):
+            raise AssertionError('Number of trials cannot be less than the '
+                                 'number of setting dates!')
+        if len(T) < 2:
+            raise AssertionError('At least two setting dates are required!')
+        if degree < 0:
+            raise ValueError(f'Invalid degree {degree}, expected >= 0')
+
+        # Generation start
+        ntrials = int(ntrials // len(T))
+        paths = self._generate(T, ntrials, antithetic)
+        values, coeffs = self._regress(T, paths, degree)
+
+        if independent:
+            paths = self._generate(T, ntrials, antithetic)
+            values = self._exercise(T, paths, coeffs, degree)
+
+        # Combine the antithetic pairs
+        if antithetic:
+            values = [
+                (values[idx] + values[idx + 1]) / 2
+                for idx in range(0, len(values), 2)
+            ]
+
+        # Payoff expectation and standard error
+        exp_payoff = mean(values)
+        stderr = stdev(values, exp_payoff) / math.sqrt(ntrials)
+
+        return MCResult(exp_payoff, stderr)
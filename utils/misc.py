@@ -7,10 +7,11 @@
 Miscellaneous utility methods.
 """
 
-from typing import Any, Union
+import os
+from typing import Any, List, Optional, Sequence, Tuple, Union
 
 
-__all__ = ['Number', 'is_num', 'is_pos']
+__all__ = ['Number', 'is_num', 'is_pos', 'union_grid', 'available_memory']
 
 
 _T = (int, float)
@@ -71,3 +72,64 @@ def is_pos(val: Any) -> bool:
     if not val >= 0:
         return False
     return True
+
+
+def union_grid(
+        Ts: Sequence[Sequence[Number]]
+) -> Tuple[List[Number], List[List[int]]]:
+    """
+    Merge several sets of times into a single sorted grid.
+
+    Parameters
+    ----------
+    Ts : Sequence of Sequences of Numbers
+        Sets of times {t1, t2, ..., tn} in years, all starting at the same t1.
+
+    Returns
+    -------
+    grid : List of Numbers
+        Sorted union of all the times.
+    indices : List of Lists of ints
+        For each input set, the position of each of its times in `grid`.
+
+    Examples
+    --------
+    >>> from utils.misc import union_grid
+    >>> print(union_grid([[0, 0.5, 1], [0, 0.25, 0.5]]))
+    ([0, 0.25, 0.5, 1], [[0, 2, 3], [0, 1, 2]])
+
+    """
+    if len(Ts) == 0:
+        raise AssertionError('At least one set of times is required!')
+    if any(len(T) == 0 for T in Ts):
+        raise AssertionError('Sets of times cannot be empty!')
+    if len(set(T[0] for T in Ts)) != 1:
+        raise AssertionError('All sets of times must share the same start!')
+
+    grid = sorted(set(t for T in Ts for t in T))
+    position = {t: idx for idx, t in enumerate(grid)}
+    indices = [[position[t] for t in T] for T in Ts]
+    return grid, indices
+
+
+def available_memory() -> Optional[int]:
+    """
+    Physical memory currently available, in bytes.
+
+    Returns
+    -------
+    int, optional
+        Available memory, or None if it cannot be determined on this
+        platform.
+
+    Examples
+    --------
+    >>> from utils.misc import available_memory
+    >>> print(available_memory())
+    5176532992
+
+    """
+    try:
+        return os.sysconf('SC_AVPHYS_PAGES') * os.sysconf('SC_PAGE_SIZE')
+    except (AttributeError, ValueError, OSError):
+        return None
@@ -9,14 +9,34 @@ Path generator for underlying.
 
 import math
 import random
-from copy import deepcopy
 from dataclasses import dataclass
-from typing import List, Sequence, Tuple
+from typing import Any, List, Optional, Protocol, Sequence, Tuple
 
+from utils.linalg import Matrix, cholesky, eigh
 from utils.misc import Number
 
 
-__all__ = ['PathGenerator']
+__all__ = ['BasePath', 'PathGenerator', 'MultiPathGenerator']
+
+
+class BasePath(Protocol):
+    """
+    Interface of the path generators, for a single or several underlyings,
+    whose paths are passed to the payoffs as they are.
+
+    """
+
+    @property
+    def discount_rate(self) -> float:
+        """Rate at which payoffs are discounted."""
+
+    def generate(self, T: Sequence[Number]) -> Sequence[Any]:
+        """Generate a random path."""
+
+    def generate_antithetic(
+            self, T: Sequence[Number]
+    ) -> Tuple[Sequence[Any], Sequence[Any]]:
+        """Generate a random plus antithetic path."""
 
 
 @dataclass
@@ -35,6 +55,7 @@ class PathGenerator:
     vol : Number
         Volatility.
     net_r
+    discount_rate
 
     Methods
     -------
@@ -63,6 +84,15 @@ class PathGenerator:
         """Net risk free rate."""
         return float(self.r - self.div)
 
+    @property
+    def discount_rate(self) -> float:
+        """
+        Rate at which payoffs are discounted, the risk free rate. The net
+        rate r - d only enters the drift.
+
+        """
+        return float(self.r)
+
     def generate(self, T: Sequence[Number]) -> List[float]:
         """
         Generate a random path {S_t1, S_t2, ..., S_tn}.
@@ -142,7 +172,7 @@ class PathGenerator:
         spot_prices: List[float] = [0] * len(T)
         spot_prices[0] = self.S
 
-        a_spot_prices = deepcopy(spot_prices)
+        a_spot_prices = list(spot_prices)
 
         for idx, dt in enumerate(dts):
             # Calculate the drift e^{(r - (1/2) σ²) Δt}
@@ -163,3 +193,191 @@ class PathGenerator:
             a_spot_prices[idx + 1] = a_S_t
 
         return (spot_prices, a_spot_prices)
+
+
+class MultiPathGenerator:
+    """
+    Class for generating the prices of several correlated underlyings using
+    MC techniques.
+
+    The correlation matrix is factorised once, either exactly by Cholesky or
+    by PCA keeping only the leading factors, in which case the factor
+    loadings are rescaled so that every underlying keeps unit variance.
+
+    Attributes
+    ----------
+    S : Sequence of Numbers
+        Spot prices.
+    r : Sequence of Numbers
+        Risk-free interest rates, which must all be equal.
+    div : Sequence of Numbers
+        Dividend yields.
+    vol : Sequence of Numbers
+        Volatilities.
+    corr : Sequence of Sequences of Numbers
+        Correlation matrix.
+    nfactors : int, optional
+        Number of PCA factors to keep, all factors with Cholesky if None.
+    discount_rate
+
+    Methods
+    -------
+    generate(T)
+        Generate a random path for each underlying.
+    generate_antithetic(T)
+        Generate a random plus antithetic path for each underlying.
+
+    Examples
+    --------
+    >>> from utils.path import MultiPathGenerator
+    >>> path = MultiPathGenerator(S=[100., 50.], r=[0.1, 0.1], div=[0.01, 0.],
+    ...                           vol=[0.3, 0.2], corr=[[1., 0.5], [0.5, 1.]])
+    >>> print(path)
+    MultiPathGenerator(S=[100.0, 50.0], r=[0.1, 0.1], div=[0.01, 0.0],
+                       vol=[0.3, 0.2], corr=[[1.0, 0.5], [0.5, 1.0]],
+                       nfactors=None)
+
+    """
+    __slots__ = 'S', 'r', 'div', 'vol', 'corr', 'nfactors', '_factor'
+
+    def __init__(
+            self,
+            S: Sequence[Number],
+            r: Sequence[Number],
+            div: Sequence[Number],
+            vol: Sequence[Number],
+            corr: Sequence[Sequence[Number]],
+            nfactors: Optional[int] = None
+    ) -> None:
+        nassets = len(S)
+        if any(len(x) != nassets for x in (r, div, vol)):
+            raise ValueError('S, r, div and vol must have the same length!')
+        if any(x != r[0] for x in r):
+            raise ValueError('All underlyings must share the same risk-free '
+                             'rate!')
+        if len(corr) != nassets or any(len(x) != nassets for x in corr):
+            raise ValueError(f'Expected a {nassets}x{nassets} correlation '
+                             'matrix!')
+        if nfactors is not None and not 1 <= nfactors <= nassets:
+            raise ValueError(f'Invalid nfactors {nfactors}, expected in '
+                             f'[1, {nassets}]')
+        self.S = list(S)
+        self.r = list(r)
+        self.div = list(div)
+        self.vol = list(vol)
+        self.corr = [list(x) for x in corr]
+        self.nfactors = nfactors
+        self._factor: Matrix = self._factorise()
+
+    def __repr__(self) -> str:
+        return (
+            f'{self.__class__.__name__}('
+            f'S={self.S!r}, '
+            f'r={self.r!r}, '
+            f'div={self.div!r}, '
+            f'vol={self.vol!r}, '
+            f'corr={self.corr!r}, '
+            f'nfactors={self.nfactors!r}'
+            ')'
+        )
+
+    def _factorise(self) -> Matrix:
+        """Factor loadings L of the correlation matrix, corr ≈ L Lᵀ."""
+        if self.nfactors is None:
+            return cholesky(self.corr)
+
+        # Keep the leading principal components
+        w, V = eigh(self.corr)
+        factor = [
+            [x * math.sqrt(max(w[k], 0.)) for k, x in
+             enumerate(row[:self.nfactors])]
+            for row in V
+        ]
+        # Rescale to unit variance
+        for row in factor:
+            norm = math.sqrt(sum(x**2 for x in row))
+            if norm > 0:
+                row[:] = [x / norm for x in row]
+        return factor
+
+    @property
+    def nassets(self) -> int:
+        """Number of underlyings."""
+        return len(self.S)
+
+    @property
+    def discount_rate(self) -> float:
+        """
+        Rate at which payoffs are discounted, the common risk free rate as
+        for `PathGenerator`. The net rates r - d of the underlyings only
+        enter their drifts.
+
+        """
+        return float(self.r[0])
+
+    def _paths(
+            self, T: Sequence[Number], signs: Sequence[float]
+    ) -> List[List[List[float]]]:
+        """Generate paths sharing the same random numbers up to a sign."""
+        dts = [T[idx + 1] - T[idx] for idx in range(len(T) - 1)]
+        nassets, factor = self.nassets, self._factor
+        nfactors = len(factor[0])
+        paths = [[[S] for S in self.S] for _ in signs]
+        for dt in dts:
+            # Correlated normal variates
+            rdm_gauss = [random.gauss(0, 1) for _ in range(nfactors)]
+            corr_gauss = [
+                sum(x * y for x, y in zip(row, rdm_gauss)) for row in factor
+            ]
+            for a_idx in range(nassets):
+                # Calculate the drift e^{(r - (1/2) σ²) Δt}
+                net_r = self.r[a_idx] - self.div[a_idx]
+                vol = self.vol[a_idx]
+                drift = math.exp((net_r - (1/2) * vol**2) * dt)
+                vol_dt = vol * math.sqrt(dt) * corr_gauss[a_idx]
+
+                # Calculate next spot price
+                for path, sign in zip(paths, signs):
+                    spot_prices = path[a_idx]
+                    spot_prices.append(
+                        spot_prices[-1] * drift * math.exp(sign * vol_dt)
+                    )
+        return paths
+
+    def generate(self, T: Sequence[Number]) -> List[List[float]]:
+        """
+        Generate a random path {S_t1, S_t2, ..., S_tn} for each underlying.
+
+        Parameters
+        ----------
+        T : Sequence of Numbers
+            Set of times {t1, t2, ..., tn} in years.
+
+        Returns
+        -------
+        spot_prices : List of Lists of floats
+            Set of prices for each underlying, indexed by underlying then
+            time.
+
+        """
+        return self._paths(T, (1.,))[0]
+
+    def generate_antithetic(
+            self, T: Sequence[Number]
+    ) -> Tuple[List[List[float]], List[List[float]]]:
+        """
+        Generate a random plus antithetic path for each underlying.
+
+        Parameters
+        ----------
+        T : Sequence of Numbers
+            Set of times {t1, t2, ..., tn} in years.
+
+        Returns
+        -------
+        prices_tuple : Tuple of two Lists of Lists of floats
+            Set of prices for each underlying and their antithetic.
+
+        """
+        spot_prices, a_spot_prices = self._paths(T, (1., -1.))
+        return (spot_prices, a_spot_prices)
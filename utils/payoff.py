@@ -8,9 +8,9 @@ Payoff of an option.
 """
 
 from abc import ABC, abstractmethod
-from typing import AnyStr, List, Union, Sequence
+from typing import AnyStr, List, Optional, Union, Sequence, Tuple, cast
 
-from utils.enums import OptionRight, BarrierUpDown, BarrierInOut
+from utils.enums import OptionRight, BarrierUpDown, BarrierInOut, BasketType
 from utils.misc import Number
 
 
@@ -18,7 +18,9 @@ __all__ = [
     'BasePayoff',
     'VanillaPayOff',
     'AsianArithmeticPayOff',
-    'DiscreteBarrierPayOff'
+    'DiscreteBarrierPayOff',
+    'BasketAsianArithmeticPayOff',
+    'BasketDiscreteBarrierPayOff'
 ]
 
 
@@ -233,6 +235,9 @@ class DiscreteBarrierPayOff(BasePayoff):
 
     Methods
     -------
+    activated(S)
+        Whether the option is active given a set of prices for the
+        underlying.
     calculate(S)
         Calulate the payoff given a set of prices for the underlying.
 
@@ -312,9 +317,10 @@ class DiscreteBarrierPayOff(BasePayoff):
                 f'Expected str or BarrierInOut, instead got type {type(val)}!'
             )
 
-    def calculate(self, S: Sequence[Number]) -> float:
+    def activated(self, S: Sequence[Number]) -> bool:
         """
-        Calulate the payoff given a set of prices for the underlying.
+        Whether the option is active given a set of prices for the
+        underlying, that is not knocked out or knocked in.
 
         Parameters
         ----------
@@ -323,20 +329,21 @@ class DiscreteBarrierPayOff(BasePayoff):
 
         Returns
         -------
-        payoff : float
-            Payoff.
+        bool
 
         Examples
         --------
         >>> from utils.payoff import DiscreteBarrierPayOff
         >>> payoff = DiscreteBarrierPayOff(option_right='Call', K=100, B=90, \
                                            barrier_updown='Down', barrier_inout='Out')
-        >>> print(payoff.calculate([100., 110., 120.]))
-        20.0
-        >>> print(payoff.calculate([100., 110., 120., 80., 110.]))
-        0.0
+        >>> print(payoff.activated([100., 110., 120., 80., 110.]))
+        False
 
         """
+        return self._activated(S)
+
+    def _activated(self, S: Sequence[Number]) -> bool:
+        """Whether the option is active given a single path."""
         # Calculate the heavyside
         H: List[int]
         if self.barrier_updown == BarrierUpDown.Up:
@@ -345,11 +352,69 @@ class DiscreteBarrierPayOff(BasePayoff):
             H = [1 if x - self.B > 0 else 0 for x in S]
 
         # Calculate whether it has been activated
-        activation: int
         if self.barrier_inout == BarrierInOut.In:
-            activation = 1 if min(H) == 0 else 0
-        else:
-            activation = min(H)
+            return min(H) == 0
+        return min(H) == 1
+
+    def calculate(self, S: Sequence[Number]) -> float:
+        """
+        Calulate the payoff given a set of prices for the underlying.
+
+        Parameters
+        ----------
+        S : Sequence of Numbers
+            Set of prices for the underlying {S_t1, S_t2, ..., S_tn}.
+
+        Returns
+        -------
+        payoff : float
+            Payoff.
+
+        Examples
+        --------
+        >>> from utils.payoff import DiscreteBarrierPayOff
+        >>> payoff = DiscreteBarrierPayOff(option_right='Call', K=100, B=90, \
+                                           barrier_updown='Down', barrier_inout='Out')
+        >>> print(payoff.calculate([100., 110., 120.]))
+        20.0
+        >>> print(payoff.calculate([100., 110., 120., 80., 110.]))
+        0.0
+
+        """
+        return self._payoff(S, self._activated(S))
+
+    def settle(self, S: Sequence[Number]) -> Tuple[float, bool]:
+        """
+        Calculate the payoff along with whether the option is active, given a
+        set of prices for the underlying.
+
+        Parameters
+        ----------
+        S : Sequence of Numbers
+            Set of prices for the underlying {S_t1, S_t2, ..., S_tn}.
+
+        Returns
+        -------
+        payoff : float
+            Payoff.
+        active : bool
+            Whether the option is active.
+
+        Examples
+        --------
+        >>> from utils.payoff import DiscreteBarrierPayOff
+        >>> payoff = DiscreteBarrierPayOff(option_right='Call', K=100, B=90, \
+                                           barrier_updown='Down', barrier_inout='Out')
+        >>> print(payoff.settle([100., 110., 120.]))
+        (20.0, True)
+
+        """
+        active = self._activated(S)
+        return self._payoff(S, active), active
+
+    def _payoff(self, S: Sequence[Number], active: bool) -> float:
+        """Payoff given a single path and whether the option is active."""
+        activation = int(active)
 
         # Calculate payoff using final price
         payoff: float
@@ -358,3 +423,299 @@ class DiscreteBarrierPayOff(BasePayoff):
         else:
             payoff = activation * self._calculate_put(S[-1])
         return payoff
+
+
+# Prices of several underlyings indexed by underlying then time, or of a
+# single underlying as for any other payoff
+BasketPrices = Union[Sequence[Number], Sequence[Sequence[Number]]]
+
+
+class BasketMixin:
+    """
+    Mixin for payoffs on several underlyings.
+
+    Its attributes are stored by the payoff classes it is mixed into.
+
+    """
+    _basket: BasketType
+    weights: Optional[Sequence[Number]]
+
+    @property
+    def basket(self) -> BasketType:
+        """How the prices of the underlyings are combined."""
+        return self._basket
+
+    @basket.setter
+    def basket(self, val: Union[AnyStr, BasketType]) -> None:
+        """Set how the prices of the underlyings are combined."""
+        if isinstance(val, str):
+            if not hasattr(BasketType, val):
+                or_names = [x.name for x in BasketType]
+                raise ValueError(f'Invalid str {val}, expected {or_names}')
+            self._basket = BasketType[val]
+        elif isinstance(val, BasketType):
+            self._basket = val
+        else:
+            raise TypeError(
+                f'Expected str or BasketType, instead got type {type(val)}!'
+            )
+
+    def aggregate(self, S: BasketPrices) -> List[float]:
+        """
+        Combine the prices of the underlyings on each date.
+
+        Parameters
+        ----------
+        S : Sequence of Sequences of Numbers
+            Set of prices for each underlying, indexed by underlying then
+            time, or the set of prices of a single underlying.
+
+        Returns
+        -------
+        List of floats
+            Weighted sum, maximum or minimum of the prices on each date.
+
+        """
+        prices: Sequence[Sequence[Number]]
+        if S and isinstance(S[0], (int, float)):
+            # Basket of a single underlying
+            prices = [cast(Sequence[Number], S)]
+        else:
+            prices = cast(Sequence[Sequence[Number]], S)
+
+        if self.basket == BasketType.BestOf:
+            return [max(x) for x in zip(*prices)]
+        if self.basket == BasketType.WorstOf:
+            return [min(x) for x in zip(*prices)]
+        weights = self.weights
+        if weights is None:
+            weights = [1 / len(prices)] * len(prices)
+        if len(weights) != len(prices):
+            raise ValueError(f'Expected {len(prices)} weights, instead got '
+                             f'{len(weights)}!')
+        return [
+            sum(w * y for w, y in zip(weights, x)) for x in zip(*prices)
+        ]
+
+
+class BasketAsianArithmeticPayOff(BasketMixin, AsianArithmeticPayOff):
+    """
+    Class for calculating the payoff of an arithmetic Asian option on a
+    basket, the best of or the worst of several underlyings.
+
+    Attributes
+    ----------
+    option_right : OptionRight
+        Right of the option.
+    K : Number
+        Strike price.
+    basket : BasketType
+        How the prices of the underlyings are combined.
+    weights : Sequence of Numbers, optional
+        Weight of each underlying in a basket, equal weights if None.
+
+    Methods
+    -------
+    aggregate(S)
+        Combine the prices of the underlyings on each date.
+    calculate(S)
+        Calulate the payoff given a set of prices for the underlyings.
+
+    Examples
+    --------
+    >>> from utils.payoff import BasketAsianArithmeticPayOff
+    >>> payoff = BasketAsianArithmeticPayOff(option_right='Call', K=100, \
+                                             basket='WorstOf')
+    >>> print(payoff)
+    BasketAsianArithmeticPayOff(K=100, option_right=Call, basket=WorstOf, weights=None)
+
+    """
+
+    def __init__(
+            self,
+            K: Number,
+            option_right: Union[AnyStr, OptionRight],
+            basket: Union[AnyStr, BasketType],
+            weights: Optional[Sequence[Number]] = None
+    ) -> None:
+        super().__init__(K, option_right)
+        # https://github.com/python/mypy/issues/3004
+        self.basket = basket  # type: ignore
+        self.weights: Optional[Sequence[Number]] = weights
+
+    def __repr__(self) -> str:
+        return (
+            f'{self.__class__.__name__}('
+            f'K={self.K!r}, '
+            f'option_right={self.option_right!r}, '
+            f'basket={self.basket!r}, '
+            f'weights={self.weights!r}'
+            ')'
+        )
+
+    def calculate(self, S: BasketPrices) -> float:
+        """
+        Calulate the payoff given a set of prices for the underlyings.
+
+        Parameters
+        ----------
+        S : Sequence of Sequences of Numbers
+            Set of prices for each underlying, indexed by underlying then
+            time, or the set of prices of a single underlying.
+
+        Returns
+        -------
+        payoff : float
+            Payoff.
+
+        Examples
+        --------
+        >>> from utils.payoff import BasketAsianArithmeticPayOff
+        >>> payoff = BasketAsianArithmeticPayOff(option_right='Call', K=100, \
+                                                 basket='Basket')
+        >>> print(payoff.calculate([[100., 120.], [100., 140.]]))
+        15.0
+
+        """
+        return super().calculate(self.aggregate(S))
+
+
+class BasketDiscreteBarrierPayOff(BasketMixin, DiscreteBarrierPayOff):
+    """
+    Class for calculating the payoff of a discrete barrier European style
+    option on a basket, the best of or the worst of several underlyings.
+
+    The barrier and the strike both apply to the combined price.
+
+    Attributes
+    ----------
+    option_right : OptionRight
+        Right of the option.
+    K : Number
+        Strike price.
+    B : Number
+        Barrier price.
+    barrier_updown : BarrierUpDown
+        Up or down type barrier option.
+    barrier_inout : BarrierInOut
+        In or out type barrier option.
+    basket : BasketType
+        How the prices of the underlyings are combined.
+    weights : Sequence of Numbers, optional
+        Weight of each underlying in a basket, equal weights if None.
+
+    Methods
+    -------
+    aggregate(S)
+        Combine the prices of the underlyings on each date.
+    activated(S)
+        Whether the option is active given a set of prices for the
+        underlyings.
+    calculate(S)
+        Calulate the payoff given a set of prices for the underlyings.
+
+    Examples
+    --------
+    >>> from utils.payoff import BasketDiscreteBarrierPayOff
+    >>> payoff = BasketDiscreteBarrierPayOff(option_right='Call', K=100, B=90, \
+                                             barrier_updown='Down', barrier_inout='Out', \
+                                             basket='WorstOf')
+    >>> print(payoff)
+    BasketDiscreteBarrierPayOff(K=100, option_right=Call, B=90, barrier_updown=Down,
+                                barrier_inout=Out, basket=WorstOf, weights=None)
+
+    """
+
+    def __init__(
+            self,
+            K: Number,
+            option_right: Union[AnyStr, OptionRight],
+            B: Number,
+            barrier_updown: Union[AnyStr, BarrierUpDown],
+            barrier_inout: Union[AnyStr, BarrierInOut],
+            basket: Union[AnyStr, BasketType],
+            weights: Optional[Sequence[Number]] = None
+    ) -> None:
+        super().__init__(K, option_right, B, barrier_updown, barrier_inout)
+        # https://github.com/python/mypy/issues/3004
+        self.basket = basket  # type: ignore
+        self.weights: Optional[Sequence[Number]] = weights
+
+    def __repr__(self) -> str:
+        return (
+            f'{self.__class__.__name__}('
+            f'K={self.K!r}, '
+            f'option_right={self.option_right!r}, '
+            f'B={self.B!r}, '
+            f'barrier_updown={self.barrier_updown!r}, '
+            f'barrier_inout={self.barrier_inout!r}, '
+            f'basket={self.basket!r}, '
+            f'weights={self.weights!r}'
+            ')'
+        )
+
+    def activated(self, S: BasketPrices) -> bool:
+        """
+        Whether the option is active given a set of prices for the
+        underlyings, that is not knocked out or knocked in.
+
+        Parameters
+        ----------
+        S : Sequence of Sequences of Numbers
+            Set of prices for each underlying, indexed by underlying then
+            time, or the set of prices of a single underlying.
+
+        Returns
+        -------
+        bool
+
+        """
+        return self._activated(self.aggregate(S))
+
+    def settle(self, S: BasketPrices) -> Tuple[float, bool]:
+        """
+        Calculate the payoff along with whether the option is active, given a
+        set of prices for the underlyings.
+
+        Parameters
+        ----------
+        S : Sequence of Sequences of Numbers
+            Set of prices for each underlying, indexed by underlying then
+            time, or the set of prices of a single underlying.
+
+        Returns
+        -------
+        payoff : float
+            Payoff.
+        active : bool
+            Whether the option is active.
+
+        """
+        return super().settle(self.aggregate(S))
+
+    def calculate(self, S: BasketPrices) -> float:
+        """
+        Calulate the payoff given a set of prices for the underlyings.
+
+        Parameters
+        ----------
+        S : Sequence of Sequences of Numbers
+            Set of prices for each underlying, indexed by underlying then
+            time, or the set of prices of a single underlying.
+
+        Returns
+        -------
+        payoff : float
+            Payoff.
+
+        Examples
+        --------
+        >>> from utils.payoff import BasketDiscreteBarrierPayOff
+        >>> payoff = BasketDiscreteBarrierPayOff(option_right='Call', K=100, B=90, \
+                                                 barrier_updown='Down', barrier_inout='Out', \
+                                                 basket='BestOf')
+        >>> print(payoff.calculate([[100., 80., 120.], [100., 95., 110.]]))
+        20.0
+
+        """
+        return super().calculate(self.aggregate(S))
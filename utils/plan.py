@@ -0,0 +1,282 @@
+# author : S. Mandalia
+#          shivesh.mandalia@outlook.com
+#
+# date   : October 18, 2026
+
+"""
+Compiled simulation plans for repeated pricing of the same option.
+"""
+
+import math
+import random
+from typing import Callable, List, Optional, Sequence
+
+from utils.engine import MCResult
+from utils.enums import OptionRight, BarrierUpDown, BarrierInOut
+from utils.misc import Number, is_num
+from utils.path import PathGenerator
+from utils.payoff import BasePayoff, VanillaPayOff, AsianArithmeticPayOff
+from utils.payoff import DiscreteBarrierPayOff
+from utils.stats import Moments
+
+
+__all__ = ['SimulationPlan']
+
+
+# Payoff of a path given its volatility terms σ √{Δt} N(0, 1) and their sign
+Kernel = Callable[[List[float], float], float]
+
+
+def _intrinsic(payoff: BasePayoff) -> Callable[[float], float]:
+    """Intrinsic value of the option for a given underlying price."""
+    K = payoff.K
+    if payoff.option_right == OptionRight.Call:
+        return lambda S: float(max(S - K, 0.0))
+    return lambda S: float(max(K - S, 0.0))
+
+
+def _vanilla_kernel(
+        S0: Number, drifts: List[float], payoff: VanillaPayOff
+) -> Kernel:
+    """Kernel for a vanilla option, only the final price is kept."""
+    intrinsic = _intrinsic(payoff)
+    exp = math.exp
+
+    def kernel(zs: List[float], sign: float) -> float:
+        S = S0
+        for drift, z in zip(drifts, zs):
+            S = S * drift * exp(sign * z)
+        return intrinsic(S)
+    return kernel
+
+
+def _asian_kernel(
+        S0: Number, drifts: List[float], payoff: AsianArithmeticPayOff
+) -> Kernel:
+    """Kernel for an arithmetic Asian option, keeping a running sum."""
+    intrinsic = _intrinsic(payoff)
+    exp = math.exp
+    ndates = len(drifts) + 1
+
+    def kernel(zs: List[float], sign: float) -> float:
+        S = total = S0
+        for drift, z in zip(drifts, zs):
+            S = S * drift * exp(sign * z)
+            total += S
+        return intrinsic(total / ndates)
+    return kernel
+
+
+def _barrier_kernel(
+        S0: Number, drifts: List[float], payoff: DiscreteBarrierPayOff
+) -> Kernel:
+    """Kernel for a discrete barrier option, keeping a survival flag."""
+    intrinsic = _intrinsic(payoff)
+    exp = math.exp
+    B = payoff.B
+    knock_in = payoff.barrier_inout == BarrierInOut.In
+    if payoff.barrier_updown == BarrierUpDown.Up:
+        def inside(S: float) -> bool:
+            return B - S > 0
+    else:
+        def inside(S: float) -> bool:
+            return S - B > 0
+
+    def kernel(zs: List[float], sign: float) -> float:
+        S = S0
+        alive = inside(S)
+        for drift, z in zip(drifts, zs):
+            S = S * drift * exp(sign * z)
+            alive = alive and inside(S)
+        activation = not alive if knock_in else alive
+        return activation * intrinsic(S)
+    return kernel
+
+
+def _generic_kernel(
+        S0: Number, drifts: List[float], payoff: BasePayoff
+) -> Kernel:
+    """Kernel for any payoff, building the full path."""
+    exp = math.exp
+
+    def kernel(zs: List[float], sign: float) -> float:
+        spot_prices = [S0]
+        for drift, z in zip(drifts, zs):
+            spot_prices.append(spot_prices[-1] * drift * exp(sign * z))
+        return payoff.calculate(spot_prices)
+    return kernel
+
+
+class SimulationPlan:
+    """
+    Class for pricing the same option many times.
+
+    The setting dates are validated once, and the per-step drift and
+    volatility factors, the discount factor and a kernel specialised to the
+    payoff are precomputed. Random numbers are drawn in the same order as
+    `PricingEngine.price`, so that both agree for the same random state with
+    `parity=False`. Knock-in options are simulated directly, without the
+    in-out parity of the engine, as the moments of a plan are accumulated
+    path by path and merged across runs.
+
+    Attributes
+    ----------
+    path : PathGenerator
+        PathGenerator object for generating the evolution of the underlying.
+    T : Tuple of Numbers
+        Set of times {t1, t2, ..., tn} in years.
+    payoff : BasePayoff
+        Payoff object for calculating the options payoff.
+    antithetic : bool
+        Use antithetic variates technique.
+    df : float
+        Discount factor to current time.
+
+    Methods
+    -------
+    simulate(npaths)
+        Accumulate the discounted payoffs of a number of paths.
+    run()
+        Price the option using MC techniques.
+
+    Notes
+    -----
+    The plan is a snapshot; changes to the path or payoff after it is built
+    are not seen by it.
+
+    Examples
+    --------
+    >>> from utils.path import PathGenerator
+    >>> from utils.payoff import AsianArithmeticPayOff
+    >>> from utils.plan import SimulationPlan
+    >>> path = PathGenerator(S=100., r=0.1, div=0.01, vol=0.3)
+    >>> payoff = AsianArithmeticPayOff(option_right='Call', K=110)
+    >>> plan = SimulationPlan(path, T=range(4), payoff=payoff)
+    >>> print(plan)
+    SimulationPlan(path=PathGenerator(S=100.0, r=0.1, div=0.01, vol=0.3),
+                   T=(0, 1, 2, 3),
+                   payoff=AsianArithmeticPayOff(K=110, option_right=Call),
+                   antithetic=True)
+
+    """
+    __slots__ = 'path', 'T', 'payoff', 'antithetic', 'df', '_drifts', \
+        '_vsds', '_kernel'
+
+    def __init__(
+            self,
+            path: PathGenerator,
+            T: Sequence[Number],
+            payoff: BasePayoff,
+            antithetic: bool = True
+    ) -> None:
+        if len(T) == 0:
+            raise AssertionError('At least one setting date is required!')
+        for t in T:
+            if not is_num(t):
+                raise TypeError(
+                    f'Expected Number, instead got type {type(t)}!'
+                )
+        dts = [T[idx + 1] - T[idx] for idx in range(len(T) - 1)]
+        if any(dt < 0 for dt in dts):
+            raise ValueError('Setting dates must be in increasing order!')
+
+        self.path: PathGenerator = path
+        self.T = tuple(T)
+        self.payoff: BasePayoff = payoff
+        self.antithetic: bool = antithetic
+
+        # Calculate the drift e^{(r - (1/2) σ²) Δt} and σ √{Δt}
+        self._drifts: List[float] = [
+            math.exp((path.net_r - (1/2) * path.vol**2) * dt) for dt in dts
+        ]
+        self._vsds: List[float] = [path.vol * math.sqrt(dt) for dt in dts]
+        self.df: float = math.exp(-path.discount_rate * (T[-1] - T[0]))
+
+        # Choose the kernel on the exact type, subclasses such as the basket
+        # payoffs may calculate the payoff differently
+        self._kernel: Kernel
+        if type(payoff) is VanillaPayOff:
+            self._kernel = _vanilla_kernel(path.S, self._drifts, payoff)
+        elif type(payoff) is AsianArithmeticPayOff:
+            self._kernel = _asian_kernel(path.S, self._drifts, payoff)
+        elif type(payoff) is DiscreteBarrierPayOff:
+            self._kernel = _barrier_kernel(path.S, self._drifts, payoff)
+        else:
+            self._kernel = _generic_kernel(path.S, self._drifts, payoff)
+
+    def __repr__(self) -> str:
+        return (
+            f'{self.__class__.__name__}('
+            f'path={self.path!r}, '
+            f'T={self.T!r}, '
+            f'payoff={self.payoff!r}, '
+            f'antithetic={self.antithetic!r}'
+            ')'
+        )
+
+    def simulate(
+            self, npaths: int, rng: Optional[random.Random] = None
+    ) -> Moments:
+        """
+        Accumulate the discounted payoffs of a number of paths.
+
+        Parameters
+        ----------
+        npaths : int
+            Number of paths, or antithetic pairs of paths, to simulate.
+        rng : random.Random, optional
+            Random number generator, defaults to the `random` module.
+
+        Returns
+        -------
+        Moments
+            Moments of the discounted payoffs.
+
+        """
+        gauss = (rng or random).gauss
+        kernel, vsds, df = self._kernel, self._vsds, self.df
+        moments = Moments()
+        for _ in range(npaths):
+            zs = [vsd * gauss(0, 1) for vsd in vsds]
+            payoff = kernel(zs, 1.)
+            if self.antithetic:
+                payoff = (payoff + kernel(zs, -1.)) / 2
+            moments.add(payoff * df)
+        return moments
+
+    def run(
+            self, ntrials: int = 10_000, seed: Optional[int] = None
+    ) -> MCResult:
+        """
+        Price the option using MC techniques.
+
+        Parameters
+        ----------
+        ntrials : int
+            Number of trials to simulate.
+        seed : int, optional
+            Seed for a dedicated random number generator, defaults to the
+            `random` module.
+
+        Returns
+        -------
+        MCResult
+            Price of the option.
+
+        Examples
+        --------
+        >>> from utils.path import PathGenerator
+        >>> from utils.payoff import AsianArithmeticPayOff
+        >>> from utils.plan import SimulationPlan
+        >>> path = PathGenerator(S=100., r=0.1, div=0.01, vol=0.3)
+        >>> payoff = AsianArithmeticPayOff(option_right='Call', K=110)
+        >>> plan = SimulationPlan(path, T=range(4), payoff=payoff)
+        >>> print(plan.run(seed=1))
+        MCResult(price=11.930703888794639, stderr=0.23640557152783467)
+
+        """
+        if ntrials < len(self.T):
+            raise AssertionError('Number of trials cannot be less than the '
+                                 'number of setting dates!')
+        rng = random.Random(seed) if seed is not None else None
+        return self.simulate(int(ntrials // len(self.T)), rng).result()
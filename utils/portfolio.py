@@ -0,0 +1,245 @@
+# author : S. Mandalia
+#          shivesh.mandalia@outlook.com
+#
+# date   : October 18, 2026
+
+"""
+Pricing a portfolio of options under a compute budget.
+"""
+
+import math
+import time
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+
+from utils.engine import MCResult, PricingEngine
+from utils.misc import Number
+from utils.stats import Moments
+
+
+__all__ = ['Trade', 'PortfolioResult', 'price_portfolio']
+
+
+@dataclass
+class Trade:
+    """
+    Option held in a portfolio.
+
+    Attributes
+    ----------
+    engine : PricingEngine
+        Pricing engine for the option.
+    T : Sequence of Numbers
+        Set of times {t1, t2, ..., tn} in years.
+    notional : Number
+        Notional of the trade.
+
+    """
+    __slots__ = ['engine', 'T', 'notional']
+    engine: PricingEngine
+    T: Sequence[Number]
+    notional: Number
+
+
+@dataclass
+class PortfolioResult:
+    """
+    Price of a portfolio along with its MC error.
+
+    Attributes
+    ----------
+    results : List of MCResult
+        Price of each trade, per unit notional.
+    ntrials : List of ints
+        Number of trials spent on each trade.
+    price : float
+        Notional weighted price of the portfolio.
+    stderr : float
+        MC standard error of the portfolio price.
+
+    """
+    __slots__ = ['results', 'ntrials', 'price', 'stderr']
+    results: List[MCResult]
+    ntrials: List[int]
+    price: float
+    stderr: float
+
+
+def _simulate(trade: Trade, ntrials: int, antithetic: bool) -> Moments:
+    """Moments of the discounted payoffs of a trade over a number of trials."""
+    result = trade.engine.price(trade.T, ntrials, antithetic)
+    return Moments.from_result(result, ntrials // len(trade.T))
+
+
+def _remaining(
+        budget: Optional[int],
+        deadline: Optional[float],
+        spent: int,
+        start: float
+) -> int:
+    """
+    Number of trials left in the budget, or estimated from the speed so far
+    to fit before the deadline.
+
+    """
+    if budget is not None:
+        return budget - spent
+    if deadline is None:
+        return 0
+    elapsed = time.perf_counter() - start
+    rate = spent / elapsed if elapsed > 0 else 0.
+    return max(int((deadline - elapsed) * rate), 0)
+
+
+def _allocate(
+        total: int,
+        spent: Sequence[int],
+        weights: Sequence[float],
+        ndates: Sequence[int]
+) -> List[int]:
+    """
+    Additional trials of each trade, bringing its total to its share of all
+    the trials in proportion to its weight.
+
+    Trades which already spent more than their share, or whose additional
+    trials would cover fewer than two paths, are left as they are and their
+    share is spread over the others.
+
+    """
+    min_trials = [2 * x for x in ndates]
+    active = [idx for idx, x in enumerate(weights) if x > 0]
+    extra = [0.] * len(spent)
+    while active:
+        pool = total - sum(
+            x for idx, x in enumerate(spent) if idx not in active
+        )
+        weight = sum(weights[idx] for idx in active)
+        for idx in active:
+            extra[idx] = pool * weights[idx] / weight - spent[idx]
+        short = [idx for idx in active if extra[idx] < min_trials[idx]]
+        if not short:
+            break
+        # Drop the trades over their share first, as dropping them only
+        # lowers the share of the others, otherwise the furthest from its
+        # minimum
+        over = [idx for idx in short if extra[idx] < 0]
+        if not over:
+            over = [min(short, key=lambda x: extra[x] - min_trials[x])]
+        active = [idx for idx in active if idx not in over]
+
+    # Whole number of paths, as in `PricingEngine.price`
+    return [
+        int(extra[idx]) // ndates[idx] * ndates[idx] if idx in active else 0
+        for idx in range(len(spent))
+    ]
+
+
+def price_portfolio(
+        trades: Sequence[Trade],
+        budget: Optional[int] = None,
+        deadline: Optional[float] = None,
+        pilot: int = 1_000,
+        antithetic: bool = True
+) -> PortfolioResult:
+    """
+    Price a portfolio of options, sharing a compute budget among the trades
+    so as to minimise the standard error of the portfolio price.
+
+    A pilot run estimates the variance of each trade, and every trade is
+    then brought up to a total number of trials in proportion to
+    |notional| × σ × √(len(T)), which minimises the notional weighted
+    variance of the portfolio for a fixed total number of trials. Trades
+    whose pilot run already exceeds their share are not simulated further,
+    and their share goes to the others.
+
+    Parameters
+    ----------
+    trades : Sequence of Trade
+        Trades in the portfolio.
+    budget : int, optional
+        Total number of trials, including the pilot runs. It must cover at
+        least two paths per trade.
+    deadline : float, optional
+        Wall-clock time in seconds, including the pilot runs.
+    pilot : int
+        Number of trials in the pilot run of each trade, shrunk to fit in
+        the budget or before the deadline.
+    antithetic : bool
+        Use antithetic variates technique.
+
+    Returns
+    -------
+    PortfolioResult
+        Price of the portfolio and of each trade.
+
+    Notes
+    -----
+    As in `PricingEngine.price`, the number of trials is shared among the
+    setting dates, so a trial costs about the same for every trade. In
+    deadline mode the budget is estimated from the speed of the runs so far,
+    and the two paths per trade of the smallest pilot runs are always
+    simulated, even if they overrun the deadline.
+
+    Examples
+    --------
+    >>> from utils.engine import PricingEngine
+    >>> from utils.path import PathGenerator
+    >>> from utils.payoff import AsianArithmeticPayOff, VanillaPayOff
+    >>> from utils.portfolio import Trade, price_portfolio
+    >>> path = PathGenerator(S=100., r=0.1, div=0.01, vol=0.3)
+    >>> T = [x / 12 for x in range(12 + 1)]
+    >>> trades = [
+    ...     Trade(PricingEngine(VanillaPayOff(K=110, option_right='Call'), path), T, 1e6),
+    ...     Trade(PricingEngine(AsianArithmeticPayOff(K=90, option_right='Put'), path), T, 1e5)
+    ... ]
+    >>> result = price_portfolio(trades, budget=100_000)
+    >>> print(result.ntrials)
+    [97721, 2275]
+
+    """
+    if (budget is None) == (deadline is None):
+        raise AssertionError('Exactly one of budget or deadline must be '
+                             'specified!')
+    # At least two paths per trade to estimate its variance
+    min_trials = [2 * len(trade.T) for trade in trades]
+    if budget is not None and budget < sum(min_trials):
+        raise AssertionError('Budget cannot cover the pilot runs, at least '
+                             f'{sum(min_trials)} trials are required!')
+    start = time.perf_counter()
+
+    # Smallest pilot runs
+    moments = [
+        _simulate(trade, m_trials, antithetic)
+        for trade, m_trials in zip(trades, min_trials)
+    ]
+    ntrials = list(min_trials)
+
+    # Rest of the pilot runs, sharing what is left equally
+    share = _remaining(budget, deadline, sum(ntrials), start) // len(trades)
+    for idx, trade in enumerate(trades):
+        n_trials = min(pilot - ntrials[idx], share)
+        n_trials = n_trials // len(trade.T) * len(trade.T)
+        if n_trials >= min_trials[idx]:
+            moments[idx].merge(_simulate(trade, n_trials, antithetic))
+            ntrials[idx] += n_trials
+
+    # Allocate the remaining trials
+    weights = [
+        abs(trade.notional) * math.sqrt(m.variance * len(trade.T))
+        for trade, m in zip(trades, moments)
+    ]
+    remaining = _remaining(budget, deadline, sum(ntrials), start)
+    extra = _allocate(sum(ntrials) + remaining, ntrials, weights,
+                      [len(trade.T) for trade in trades])
+    for idx, trade in enumerate(trades):
+        if extra[idx] > 0:
+            moments[idx].merge(_simulate(trade, extra[idx], antithetic))
+            ntrials[idx] += extra[idx]
+
+    # Portfolio price and standard error
+    results = [m.result() for m in moments]
+    price = sum(t.notional * r.price for t, r in zip(trades, results))
+    stderr = math.sqrt(
+        sum((t.notional * r.stderr)**2 for t, r in zip(trades, results))
+    )
+    return PortfolioResult(results, ntrials, price, stderr)
@@ -0,0 +1,460 @@
+# author : S. Mandalia
+#          shivesh.mandalia@outlook.com
+#
+# date   : October 18, 2026
+
+"""
+Multi-process pricing engine sharing simulated paths through shared memory.
+"""
+
+import array
+import math
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from multiprocessing import shared_memory
+from typing import List, Optional, Sequence, Tuple
+
+from utils.engine import MCResult
+from utils.misc import Number, available_memory, union_grid
+from utils.path import PathGenerator
+from utils.payoff import BasePayoff
+from utils.stats import Moments
+
+
+__all__ = ['SharedPathBlock', 'SharedMemoryEngine']
+
+
+# Payoff along with the position of its dates in the grid and discount factor
+_Task = Tuple[BasePayoff, List[int], float]
+
+# Memory reserved per payoff and worker, for the tasks and their moments
+_TASK_BYTES = 4096
+
+
+def _buffer(shm: shared_memory.SharedMemory) -> memoryview:
+    """Buffer of an open shared memory segment."""
+    if shm.buf is None:
+        raise ValueError(f'Shared memory segment {shm.name} is closed!')
+    return shm.buf
+
+
+def _cast(view: memoryview, typecode: str) -> 'memoryview[float]':
+    """Cast a view of bytes to doubles or floats."""
+    return view.cast('d') if typecode == 'd' else view.cast('f')
+
+
+class SharedPathBlock:
+    """
+    Block of simulated paths stored in shared memory.
+
+    The block owns the shared memory segment; it is released and removed
+    when the block is closed, or on leaving a `with` statement. Other
+    processes attach to it by name with `attach`.
+
+    Attributes
+    ----------
+    name : str
+        Name of the shared memory segment.
+    nrows : int
+        Number of paths.
+    ncols : int
+        Number of setting dates per path.
+    typecode : str
+        Type of the stored prices, 'd' for double or 'f' for single
+        precision.
+    array : memoryview
+        Flat view of the paths, path `i` is `array[i * ncols:(i + 1) * ncols]`.
+
+    Methods
+    -------
+    attach(name, nrows, ncols, typecode)
+        Read-only view of a block created by another process.
+    close()
+        Release and remove the shared memory segment.
+
+    Examples
+    --------
+    >>> import array
+    >>> from utils.shared import SharedPathBlock
+    >>> with SharedPathBlock(nrows=2, ncols=3) as block:
+    ...     block.array[3:6] = array.array('d', [100., 101., 102.])
+    ...     print(block.array[3:6].tolist())
+    [100.0, 101.0, 102.0]
+
+    """
+    __slots__ = 'nrows', 'ncols', 'typecode', '_shm', 'array'
+
+    def __init__(self, nrows: int, ncols: int, typecode: str = 'd') -> None:
+        if typecode not in ('d', 'f'):
+            raise ValueError(f'Invalid typecode {typecode}, expected d or f')
+        self.nrows: int = nrows
+        self.ncols: int = ncols
+        self.typecode: str = typecode
+        size = max(nrows * ncols, 1) * array.array(typecode).itemsize
+        self._shm: Optional[shared_memory.SharedMemory] = \
+            shared_memory.SharedMemory(create=True, size=size)
+        self.array = _cast(_buffer(self._shm), typecode)
+
+    def __repr__(self) -> str:
+        return (
+            f'{self.__class__.__name__}('
+            f'name={self.name!r}, '
+            f'nrows={self.nrows!r}, '
+            f'ncols={self.ncols!r}, '
+            f'typecode={self.typecode!r}'
+            ')'
+        )
+
+    def __enter__(self) -> 'SharedPathBlock':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    @property
+    def name(self) -> str:
+        """Name of the shared memory segment."""
+        if self._shm is None:
+            raise ValueError('Block is closed!')
+        return self._shm.name
+
+    @staticmethod
+    def attach(
+            name: str, nrows: int, ncols: int, typecode: str = 'd'
+    ) -> Tuple[shared_memory.SharedMemory, 'memoryview[float]']:
+        """
+        Read-only view of a block created by another process.
+
+        The caller must release the view and close the segment, but never
+        remove it as it is owned by its creator. Worker processes share the
+        resource tracker of their parent, so attaching does not register the
+        segment a second time.
+
+        Parameters
+        ----------
+        name : str
+            Name of the shared memory segment.
+        nrows : int
+            Number of paths.
+        ncols : int
+            Number of setting dates per path.
+        typecode : str
+            Type of the stored prices, 'd' for double or 'f' for single
+            precision.
+
+        Returns
+        -------
+        shm : SharedMemory
+            Shared memory segment.
+        view : memoryview
+            Read-only flat view of the paths.
+
+        """
+        shm = shared_memory.SharedMemory(name=name)
+        size = nrows * ncols * array.array(typecode).itemsize
+        with _buffer(shm)[:size] as buf:
+            view = _cast(buf.toreadonly(), typecode)
+        return shm, view
+
+    def close(self) -> None:
+        """Release and remove the shared memory segment."""
+        if self._shm is None:
+            return
+        self.array.release()
+        self._shm.close()
+        self._shm.unlink()
+        self._shm = None
+
+
+def _evaluate(
+        name: str,
+        nrows: int,
+        ncols: int,
+        typecode: str,
+        antithetic: bool,
+        tasks: Sequence[_Task],
+        npaths: Sequence[int]
+) -> List[Tuple[int, float, float]]:
+    """
+    Evaluate payoffs against a shared block of paths, each task on its given
+    number of leading paths of the block.
+
+    Returns the moments (n, mean, m2) of the discounted payoffs of each task,
+    always accumulated in double precision.
+
+    """
+    shm, view = SharedPathBlock.attach(name, nrows, ncols, typecode)
+    try:
+        step = 2 if antithetic else 1
+        moments = [Moments() for _ in tasks]
+        for row in range(0, nrows, step):
+            # Index the flat view directly, slices would hold on to it
+            offset = row * ncols
+            a_offset = offset + ncols
+            for moment, (payoff_obj, p_T_idx, df), n in \
+                    zip(moments, tasks, npaths):
+                if row >= n * step:
+                    continue
+                payoff = payoff_obj.calculate([view[offset + x] for x in p_T_idx])
+                if antithetic:
+                    a_po = payoff_obj.calculate(
+                        [view[a_offset + x] for x in p_T_idx]
+                    )
+                    payoff = (payoff + a_po) / 2
+                moment.add(payoff * df)
+        return [(x.n, x.mean, x.m2) for x in moments]
+    finally:
+        view.release()
+        shm.close()
+
+
+@dataclass
+class SharedMemoryEngine:
+    """
+    Class for pricing many options on the same underlying across several
+    processes.
+
+    Paths are simulated in blocks into shared memory on the union of all the
+    setting dates. Worker processes attach to each block read-only, evaluate
+    their share of the payoffs and return only the moments of the discounted
+    payoffs. The next block is simulated while the workers evaluate the
+    current one.
+
+    Attributes
+    ----------
+    path : PathGenerator
+        PathGenerator object for generating the evolution of the underlying.
+    nworkers : int
+        Number of worker processes.
+    block_size : int, optional
+        Number of paths, or antithetic pairs of paths, per block. Defaults to
+        the largest block that fits in the memory budget.
+    single_precision : bool
+        Store the paths in single precision, halving their memory. The
+        moments of the payoffs are still accumulated in double precision.
+    memory_budget : int, optional
+        Memory in bytes the engine may use for paths. Defaults to half of the
+        memory currently available.
+
+    Methods
+    -------
+    block_paths(ncols, npayoffs)
+        Number of paths per block within the memory budget.
+    price(schedules)
+        Price several options on a single set of simulated paths.
+
+    Examples
+    --------
+    >>> from utils.path import PathGenerator
+    >>> from utils.shared import SharedMemoryEngine
+    >>> path = PathGenerator(S=100., r=0.1, div=0.01, vol=0.3)
+    >>> engine = SharedMemoryEngine(path=path, nworkers=4, block_size=10_000)
+    >>> print(engine)
+    SharedMemoryEngine(path=PathGenerator(S=100.0, r=0.1, div=0.01, vol=0.3),
+                       nworkers=4, block_size=10000, single_precision=False,
+                       memory_budget=None)
+
+    """
+    path: PathGenerator
+    nworkers: int = field(default_factory=lambda: os.cpu_count() or 1)
+    block_size: Optional[int] = None
+    single_precision: bool = False
+    memory_budget: Optional[int] = None
+
+    @property
+    def typecode(self) -> str:
+        """Type of the stored prices."""
+        return 'f' if self.single_precision else 'd'
+
+    def block_paths(
+            self, ncols: int, npayoffs: int, antithetic: bool = True
+    ) -> int:
+        """
+        Number of paths per block within the memory budget.
+
+        Two blocks are alive at any time, one being simulated while the other
+        is evaluated, and some memory is reserved for every payoff in every
+        worker.
+
+        Parameters
+        ----------
+        ncols : int
+            Number of setting dates per path.
+        npayoffs : int
+            Number of payoffs.
+        antithetic : bool
+            Use antithetic variates technique.
+
+        Returns
+        -------
+        int
+            Number of paths, or antithetic pairs of paths, per block.
+
+        Examples
+        --------
+        >>> from utils.path import PathGenerator
+        >>> from utils.shared import SharedMemoryEngine
+        >>> path = PathGenerator(S=100., r=0.1, div=0.01, vol=0.3)
+        >>> engine = SharedMemoryEngine(path, nworkers=4, memory_budget=2**20)
+        >>> print(engine.block_paths(ncols=53, npayoffs=10))
+        521
+
+        """
+        budget = self.memory_budget
+        if budget is None:
+            available = available_memory()
+            if available is not None:
+                budget = available // 2
+            elif self.block_size is not None:
+                return self.block_size
+            else:
+                raise ValueError('Available memory is unknown, set either '
+                                 'block_size or memory_budget!')
+
+        step = 2 if antithetic else 1
+        itemsize = array.array(self.typecode).itemsize
+        path_bytes = 2 * step * ncols * itemsize
+        reserved = npayoffs * self.nworkers * _TASK_BYTES
+        npaths = (budget - reserved) // path_bytes
+        if npaths < 1:
+            raise MemoryError(f'Memory budget of {budget} bytes is too small '
+                              f'for {npayoffs} payoffs on {ncols} dates!')
+        if self.block_size is not None:
+            npaths = min(npaths, self.block_size)
+        return npaths
+
+    def _fill(
+            self,
+            block: SharedPathBlock,
+            T: Sequence[Number],
+            antithetic: bool
+    ) -> None:
+        """Simulate paths into a block."""
+        ncols = block.ncols
+        step = 2 if antithetic else 1
+        for row in range(0, block.nrows, step):
+            if not antithetic:
+                spot_prices = self.path.generate(T)
+            else:
+                prices_tuple = self.path.generate_antithetic(T)
+                spot_prices = prices_tuple[0] + prices_tuple[1]
+            block.array[row * ncols:(row + step) * ncols] = \
+                array.array(block.typecode, spot_prices)
+
+    def price(
+            self,
+            schedules: Sequence[Tuple[BasePayoff, Sequence[Number]]],
+            ntrials: int = 10_000,
+            antithetic: bool = True
+    ) -> List[MCResult]:
+        """
+        Price several options on a single set of simulated paths.
+
+        Parameters
+        ----------
+        schedules : Sequence of (BasePayoff, Sequence of Numbers) pairs
+            Payoff objects along with their set of times {t1, t2, ..., tn} in
+            years. All sets of times must share the same start t1.
+        ntrials : int
+            Number of trials to simulate per option. As in
+            `PricingEngine.price_many`, the number of paths of an option is
+            `ntrials` divided by the number of its own setting dates.
+        antithetic : bool
+            Use antithetic variates technique.
+
+        Returns
+        -------
+        List of MCResult
+            Price of each option, in the same order as `schedules`.
+
+        Examples
+        --------
+        >>> from utils.path import PathGenerator
+        >>> from utils.payoff import AsianArithmeticPayOff
+        >>> from utils.shared import SharedMemoryEngine
+        >>> path = PathGenerator(S=100., r=0.1, div=0.01, vol=0.3)
+        >>> payoff = AsianArithmeticPayOff(option_right='Call', K=110)
+        >>> engine = SharedMemoryEngine(path, nworkers=2, block_size=1_000)
+        >>> monthly = [x / 12 for x in range(12 + 1)]
+        >>> quarterly = [x / 4 for x in range(4 + 1)]
+        >>> print(engine.price([(payoff, monthly), (payoff, quarterly)]))
+        [MCResult(price=4.470547342123252, stderr=0.19750257226682677),
+         MCResult(price=4.252825804331295, stderr=0.12172569601279974)]
+
+        """
+        T, indices = union_grid([x[1] for x in schedules])
+        if any(ntrials < len(x[1]) for x in schedules):
+            raise AssertionError('Number of trials cannot be less than the '
+                                 'number of setting dates!')
+        if self.nworkers < 1 or \
+                (self.block_size is not None and self.block_size < 1):
+            raise ValueError('Number of workers and block size must be '
+                             'positive!')
+        block_size = self.block_paths(len(T), len(schedules), antithetic)
+
+        # Share the payoffs among the workers
+        tasks: List[_Task] = [
+            (payoff_obj, p_T_idx,
+             math.exp(-self.path.discount_rate * (p_T[-1] - p_T[0])))
+            for (payoff_obj, p_T), p_T_idx in zip(schedules, indices)
+        ]
+        nslice = math.ceil(len(tasks) / self.nworkers)
+        slices = [
+            (idx, tasks[idx:idx + nslice])
+            for idx in range(0, len(tasks), nslice)
+        ]
+
+        # Generation start, with the number of paths of each option as if it
+        # were priced alone
+        opt_paths = [int(ntrials // len(x[1])) for x in schedules]
+        ntrials = max(opt_paths)
+        moments = [Moments() for _ in tasks]
+        step = 2 if antithetic else 1
+        blocks: List[SharedPathBlock] = []
+        pending: Optional[Tuple[SharedPathBlock, List[Future]]] = None
+        try:
+            with ProcessPoolExecutor(max_workers=len(slices)) as executor:
+                for start in range(0, ntrials, block_size):
+                    npaths = min(block_size, ntrials - start)
+                    block = SharedPathBlock(npaths * step, len(T),
+                                            self.typecode)
+                    blocks.append(block)
+                    self._fill(block, T, antithetic)
+                    futures = [
+                        executor.submit(
+                            _evaluate, block.name, block.nrows, block.ncols,
+                            block.typecode, antithetic, x[1],
+                            [min(max(n - start, 0), npaths)
+                             for n in opt_paths[x[0]:x[0] + len(x[1])]]
+                        )
+                        for x in slices
+                    ]
+
+                    # Collect the previous block while this one is evaluated
+                    if pending is not None:
+                        self._collect(pending, slices, moments)
+                    pending = (block, futures)
+                if pending is not None:
+                    self._collect(pending, slices, moments)
+        finally:
+            # The workers are done once the executor has shut down
+            for block in blocks:
+                block.close()
+
+        return [x.result() for x in moments]
+
+    @staticmethod
+    def _collect(
+            pending: Tuple[SharedPathBlock, List[Future]],
+            slices: List[Tuple[int, List[_Task]]],
+            moments: List[Moments]
+    ) -> None:
+        """Merge the results of a block and release it."""
+        block, futures = pending
+        try:
+            for (offset, _), future in zip(slices, futures):
+                for idx, x in enumerate(future.result()):
+                    moments[offset + idx].merge(Moments(*x))
+        finally:
+            block.close()
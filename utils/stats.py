@@ -0,0 +1,157 @@
+# author : S. Mandalia
+#          shivesh.mandalia@outlook.com
+#
+# date   : October 18, 2026
+
+"""
+Statistics utility classes.
+"""
+
+import math
+from typing import Iterable
+
+from utils.engine import MCResult
+
+
+__all__ = ['Moments']
+
+
+class Moments:
+    """
+    Class for accumulating the mean and variance of a set of samples.
+
+    Accumulators built from separate sets of samples can be merged, which
+    gives the same result as accumulating all the samples together.
+
+    Attributes
+    ----------
+    n : int
+        Number of samples.
+    mean : float
+        Mean of the samples.
+    variance : float
+        Sample variance.
+    stderr : float
+        Standard error on the mean.
+
+    Methods
+    -------
+    add(x)
+        Add a sample.
+    extend(xs)
+        Add a set of samples.
+    merge(other)
+        Merge another accumulator into this one.
+    from_result(result, n)
+        Rebuild an accumulator from a MC result.
+    result()
+        MC result for the accumulated samples.
+
+    Examples
+    --------
+    >>> from utils.stats import Moments
+    >>> moments = Moments()
+    >>> moments.extend([1., 2., 3., 4.])
+    >>> print(moments)
+    Moments(n=4, mean=2.5, variance=1.6666666666666667)
+
+    """
+    __slots__ = 'n', 'mean', 'm2'
+
+    def __init__(self, n: int = 0, mean: float = 0., m2: float = 0.) -> None:
+        self.n: int = n
+        self.mean: float = mean
+        # Sum of squared differences from the mean
+        self.m2: float = m2
+
+    def __repr__(self) -> str:
+        return (
+            f'{self.__class__.__name__}('
+            f'n={self.n!r}, '
+            f'mean={self.mean!r}, '
+            f'variance={self.variance!r}'
+            ')'
+        )
+
+    @property
+    def variance(self) -> float:
+        """Sample variance."""
+        if self.n < 2:
+            return 0.
+        return self.m2 / (self.n - 1)
+
+    @property
+    def stderr(self) -> float:
+        """Standard error on the mean."""
+        if self.n < 2:
+            return 0.
+        return math.sqrt(self.variance / self.n)
+
+    def add(self, x: float) -> None:
+        """Add a sample."""
+        self.n += 1
+        delta = x - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (x - self.mean)
+
+    def extend(self, xs: Iterable[float]) -> None:
+        """Add a set of samples."""
+        for x in xs:
+            self.add(x)
+
+    def merge(self, other: 'Moments') -> 'Moments':
+        """
+        Merge another accumulator into this one.
+
+        Parameters
+        ----------
+        other : Moments
+            Accumulator to merge.
+
+        Returns
+        -------
+        Moments
+            This accumulator.
+
+        Examples
+        --------
+        >>> from utils.stats import Moments
+        >>> a, b = Moments(), Moments()
+        >>> a.extend([1., 2.])
+        >>> b.extend([3., 4.])
+        >>> print(a.merge(b))
+        Moments(n=4, mean=2.5, variance=1.6666666666666667)
+
+        """
+        n = self.n + other.n
+        if n == 0:
+            return self
+        delta = other.mean - self.mean
+        self.mean += delta * other.n / n
+        self.m2 += other.m2 + delta**2 * self.n * other.n / n
+        self.n = n
+        return self
+
+    @classmethod
+    def from_result(cls, result: MCResult, n: int) -> 'Moments':
+        """
+        Rebuild an accumulator from a MC result.
+
+        Parameters
+        ----------
+        result : MCResult
+            Price of the option along with its MC error.
+        n : int
+            Number of samples the result was calculated from.
+
+        Returns
+        -------
+        Moments
+
+        """
+        m2 = (result.stderr * math.sqrt(n))**2 * (n - 1) if n > 1 else 0.
+        return cls(n, result.price, m2)
+
+    def result(self) -> MCResult:
+        """MC result for the accumulated samples."""
+        return MCResult(self.mean, self.stderr)